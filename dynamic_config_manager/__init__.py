@@ -59,7 +59,7 @@ cam_cfg.restore_value("spindle_speed", source="default")
 
 from __future__ import annotations
 
-from importlib import metadata as _meta
+import importlib as _importlib
 import logging as _logging
 
 # --------------------------------------------------------------------- #
@@ -95,7 +95,21 @@ from .validation import (
     PathPolicy,
     MultipleRangesPolicy,
 )
-from .watchers import watch_and_reload
+
+# Imported on first access (PEP 562): the watcher pulls in the optional
+# ``watchfiles`` dependency, which plain config users never need.
+_LAZY = {
+    "watch_and_reload": ".watchers",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(_importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "ConfigManager",
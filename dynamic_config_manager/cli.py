@@ -4,18 +4,16 @@ import argparse
 import json
 from pathlib import Path
 
-from .manager import _load_file, _dump_file
+from .manager import _dump_file, _json_dumps, _load_file
 
 
 def _cmd_show(args: argparse.Namespace) -> None:
     data = _load_file(Path(args.file))
-    print(json.dumps(data, indent=4))
+    print(_json_dumps(data).decode("utf-8"))
 
 
-def _cmd_set(args: argparse.Namespace) -> None:
-    path = Path(args.file)
-    data = _load_file(path)
-    keys = args.key.split(".")
+def _assign(data: dict, key: str, value) -> None:
+    keys = key.split(".")
     cur = data
     for k in keys[:-1]:
         nxt = cur.get(k)
@@ -23,7 +21,33 @@ def _cmd_set(args: argparse.Namespace) -> None:
             nxt = {}
             cur[k] = nxt
         cur = nxt
-    cur[keys[-1]] = args.value
+    cur[keys[-1]] = value
+
+
+def _parse_pair(text: str) -> tuple[str, str]:
+    key, sep, value = text.partition("=")
+    if not sep or not key:
+        raise argparse.ArgumentTypeError(f"expected KEY=VALUE, got '{text}'")
+    return key, value
+
+
+def _cmd_set(args: argparse.Namespace) -> None:
+    path = Path(args.file)
+    data = _load_file(path)
+    _assign(data, args.key, args.value)
+    _dump_file(path, data)
+
+
+def _cmd_set_many(args: argparse.Namespace) -> None:
+    path = Path(args.file)
+    data = _load_file(path)
+    for key, value in args.pairs:
+        if args.json_value:
+            try:
+                value = json.loads(value)
+            except json.JSONDecodeError as e:
+                raise SystemExit(f"Invalid JSON value for '{key}': {e}") from e
+        _assign(data, key, value)
     _dump_file(path, data)
 
 
@@ -41,6 +65,12 @@ def main(argv: list[str] | None = None) -> None:
     p_set.add_argument("value")
     p_set.set_defaults(func=_cmd_set)
 
+    p_many = sub.add_parser("set-many", help="Set several values with a single read and write")
+    p_many.add_argument("file")
+    p_many.add_argument("pairs", nargs="+", type=_parse_pair, metavar="KEY=VALUE")
+    p_many.add_argument("--json-value", action="store_true", help="Parse each VALUE as JSON")
+    p_many.set_defaults(func=_cmd_set_many)
+
     args = parser.parse_args(argv)
     args.func(args)
 
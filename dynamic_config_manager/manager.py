@@ -3,27 +3,54 @@
 # =============================================================
 from __future__ import annotations
 
+import atexit
+import copy
+import datetime
+import enum
+import hashlib
 import json
 import logging
+import mmap
+import operator
 import os
+import sys
 import tempfile
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union, Generic
-
-from pydantic import BaseModel, ValidationError
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from decimal import Decimal
+from functools import lru_cache, partial
+from pathlib import Path, PurePath
+from typing import (
+    Annotated, Any, BinaryIO, Callable, Dict, List, Literal, Optional, Sequence, Tuple, Type, TypeVar, Union,
+    Generic, get_args, get_origin,
+)
+
+import annotated_types
+from pydantic import BaseModel, ConfigDict, Field, PydanticUserError, TypeAdapter, ValidationError
 from pydantic.fields import FieldInfo, PydanticUndefined
-from pydantic_core import to_jsonable_python
+from pydantic_core import to_json
 from pydantic_settings import BaseSettings
 
+try:  # optional faster JSON reader; writing always goes through pydantic-core
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 __all__ = ["ConfigManager"]
 
 log = logging.getLogger(__name__)
 T = TypeVar("T", bound=BaseSettings)
 
+_UNSET: Any = object()  # marker for not-yet-built models
+
 
 class _ActiveAccessorProxy(Generic[T]):
     """Attribute style accessor for active values."""
 
+    __slots__ = ("_inst", "_prefix")
+
     def __init__(self, inst: "ConfigInstance", prefix: str = ""):
         object.__setattr__(self, "_inst", inst)
         object.__setattr__(self, "_prefix", prefix)
@@ -43,28 +70,36 @@ class _ActiveAccessorProxy(Generic[T]):
 class _MetaAccessorProxy(Generic[T]):
     """Attribute style accessor for field metadata."""
 
+    __slots__ = ("_inst", "_prefix")
+
     def __init__(self, inst: "ConfigInstance", prefix: str = ""):
         object.__setattr__(self, "_inst", inst)
         object.__setattr__(self, "_prefix", prefix)
 
     def __getattr__(self, item: str):
         path = f"{self._prefix}.{item}" if self._prefix else item
-        meta = self._inst.get_metadata(path)
-        if hasattr(meta.get("type"), "model_fields"):
+        try:
+            _field, head, _tail = _resolve_field(self._inst._model_cls, _split_path(path))
+        except KeyError:
+            raise AttributeError(item) from None
+        # nested sections need no metadata (or file read) of their own
+        if hasattr(head["type"], "model_fields"):
             return _MetaAccessorProxy(self._inst, path)
-        return meta
+        return self._inst.get_metadata(path)
 
 
 class _DefaultAccessorProxy(Generic[T]):
     """Attribute style accessor for default values (read-only)."""
 
+    __slots__ = ("_inst", "_prefix")
+
     def __init__(self, inst: "ConfigInstance", prefix: str = ""):
         object.__setattr__(self, "_inst", inst)
         object.__setattr__(self, "_prefix", prefix)
 
     def __getattr__(self, item: str):
         path = f"{self._prefix}.{item}" if self._prefix else item
-        val = _deep_get(self._inst._defaults, path.split("."))
+        val = _deep_get(self._inst._defaults, _split_path(path))
         if isinstance(val, BaseModel):
             return _DefaultAccessorProxy(self._inst, path)
         return val
@@ -74,17 +109,24 @@ class _DefaultAccessorProxy(Generic[T]):
 
 
 class _SavedAccessorProxy(Generic[T]):
-    """Attribute style accessor for values persisted on disk (read-only)."""
+    """Attribute style accessor for values persisted on disk (read-only).
 
-    def __init__(self, inst: "ConfigInstance", prefix: str = ""):
-        object.__setattr__(self, "_inst", inst)
-        object.__setattr__(self, "_prefix", prefix)
+    The saved file is parsed once when the root proxy is created; nested
+    proxies walk that same model instead of looking the file up again.
+    """
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node: BaseModel | None):
+        object.__setattr__(self, "_node", node)
 
     def __getattr__(self, item: str):
-        path = f"{self._prefix}.{item}" if self._prefix else item
-        val = self._inst._get_saved_value(path)
+        try:
+            val = getattr(self._node, item)
+        except AttributeError:
+            return PydanticUndefined
         if isinstance(val, BaseModel):
-            return _SavedAccessorProxy(self._inst, path)
+            return _SavedAccessorProxy(val)
         return val
 
     def __setattr__(self, item: str, value: Any):
@@ -96,7 +138,14 @@ class _SavedAccessorProxy(Generic[T]):
 # --------------------------------------------------------------------------- #
 
 
-def _deep_get(data: Any, keys: List[str]) -> Any:
+@lru_cache(maxsize=4096)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """Return the interned key tuple for a dotted ``path``."""
+
+    return tuple(sys.intern(k) for k in path.split("."))
+
+
+def _deep_get(data: Any, keys: Sequence[str]) -> Any:
     cur = data
     for key in keys:
         if isinstance(cur, BaseModel):
@@ -110,135 +159,468 @@ def _deep_get(data: Any, keys: List[str]) -> Any:
     return cur
 
 
-def _deep_set(data: Any, keys: List[str], value: Any) -> BaseModel | Any:
-    """Return a copy of ``data`` with ``value`` written at ``keys`` path."""
+# what reading a missing or mistyped path raises; anything else is a real error
+_LOOKUP_ERRORS = (AttributeError, KeyError, IndexError, TypeError, ValueError)
 
-    if not keys:
-        return value
 
-    head, *tail = keys
+@lru_cache(maxsize=4096)
+def _path_getter(model_cls: Type[BaseModel], path: str) -> Callable[[Any], Any]:
+    """Return a function reading ``path`` from an instance of ``model_cls``.
 
-    # normalise None so that intermediate containers can be created
-    if data is None:
-        data = [] if head.isdigit() else {}
+    Paths made only of model fields resolve with a single C-level
+    ``operator.attrgetter``; paths into list/dict values fall back to
+    :func:`_deep_get`.
+    """
+    keys = _split_path(path)
+    if keys in _field_table(model_cls):
+        return operator.attrgetter(path)
+    return partial(_deep_get, keys=keys)
 
-    if isinstance(data, BaseModel):
-        copied = data.model_dump(mode="python")
-        next_val = copied.get(head)
-        copied[head] = _deep_set(next_val, tail, value)
-        return data.__class__(**copied)
 
-    if isinstance(data, dict):
-        copied = {**data}
-        next_val = copied.get(head)
-        copied[head] = _deep_set(next_val, tail, value)
-        return copied
+def _deep_set(data: Any, keys: Sequence[str], value: Any) -> BaseModel | Any:
+    """Return a copy of ``data`` with ``value`` written at ``keys`` path.
 
-    if isinstance(data, list):
-        idx = int(head)
-        copied = list(data)
-        while len(copied) <= idx:
-            copied.append(None)
-        copied[idx] = _deep_set(copied[idx], tail, value)
-        return copied
+    Untouched branches are shared with ``data``; only the containers along
+    ``keys`` are copied. Models are rebuilt with ``model_copy(update=...)``,
+    so the written value is *not* validated.
+    """
 
-    raise KeyError(f"Cannot traverse into {type(data)} with '{head}'.")
+    stack: List[Tuple[Any, Any]] = []
+    cur = data
+    for key in keys:
+        # normalise None so that intermediate containers can be created
+        if cur is None:
+            cur = [] if key.isdigit() else {}
+        if isinstance(cur, BaseModel):
+            stack.append((cur, key))
+            cur = getattr(cur, key, None)
+        else:
+            cur = _descend(cur, key, stack)
+    return _rebuild_path(stack, value)
 
 
-def _deep_set_dict(data: Any, keys: List[str], value: Any) -> Any:
+def _deep_set_dict(data: Any, keys: Sequence[str], value: Any, *, in_place: bool = False) -> Any:
     """Return a plain Python structure with ``value`` set at ``keys`` path.
 
     Similar to :func:`_deep_set` but never instantiates Pydantic models.
     All ``BaseModel`` instances are treated as dictionaries via
     ``model_dump(mode="python")`` so that validation only happens once when the
     full model is reconstructed. This avoids early validation errors before
-    any auto-fix logic runs.
+    any auto-fix logic runs. With ``in_place`` the dicts and lists along the
+    path are updated directly instead of copied; the caller must own them.
     """
 
-    if not keys:
-        return value
+    stack: List[Tuple[Any, Any]] = []
+    cur = data
+    for key in keys:
+        if isinstance(cur, BaseModel):
+            cur = cur.model_dump(mode="python")
+        if cur is None:
+            cur = [] if key.isdigit() else {}
+        cur = _descend(cur, key, stack)
+    return _rebuild_path(stack, value, in_place=in_place)
+
+
+def _descend(container: Any, key: str, stack: List[Tuple[Any, Any]]) -> Any:
+    """Push ``(container, key)`` onto ``stack`` and return the child at ``key``."""
+    if isinstance(container, dict):
+        stack.append((container, key))
+        return container.get(key)
+    if isinstance(container, list):
+        idx = int(key)
+        stack.append((container, idx))
+        return container[idx] if idx < len(container) else None
+    raise KeyError(f"Cannot traverse into {type(container)} with '{key}'.")
+
+
+def _rebuild_path(stack: List[Tuple[Any, Any]], value: Any, *, in_place: bool = False) -> Any:
+    """Copy each container on ``stack`` bottom-up with the new child in place.
+
+    With ``in_place`` dicts and lists are written directly instead of copied.
+    """
+    for container, key in reversed(stack):
+        if isinstance(container, BaseModel):
+            value = container.model_copy(update={key: value})
+        elif isinstance(container, dict):
+            if in_place:
+                container[key] = value
+                value = container
+            else:
+                value = {**container, key: value}
+        else:
+            copied = container if in_place else list(container)
+            if len(copied) <= key:
+                copied.extend([None] * (key + 1 - len(copied)))
+            copied[key] = value
+            value = copied
+    return value
+
+
+# ---------- targeted validation --------------------------------------------- #
+
+# model_config keys that change how a single field value is validated
+_ADAPTER_CONFIG_KEYS = (
+    "strict",
+    "arbitrary_types_allowed",
+    "str_strip_whitespace",
+    "str_to_lower",
+    "str_to_upper",
+    "str_min_length",
+    "str_max_length",
+    "coerce_numbers_to_str",
+    "allow_inf_nan",
+    "use_enum_values",
+    "regex_engine",
+)
+
+
+@lru_cache(maxsize=1024)
+def _validators_touch(model_cls: Type[BaseModel], name: str) -> bool:
+    """True if a model or field validator of ``model_cls`` may observe ``name``."""
+    decorators = model_cls.__pydantic_decorators__
+    if decorators.model_validators:
+        return True
+    for dec in decorators.field_validators.values():
+        if name in dec.info.fields or "*" in dec.info.fields:
+            return True
+    return False
+
+
+@lru_cache(maxsize=1024)
+def _field_adapter(model_cls: Type[BaseModel], name: str) -> TypeAdapter | None:
+    """Return a validator for the single field ``name`` of ``model_cls``.
+
+    ``None`` means the field cannot be validated in isolation and the whole
+    model has to be rebuilt instead.
+    """
+    field = model_cls.model_fields.get(name)
+    if field is None or _validators_touch(model_cls, name):
+        return None
+    # only what validates the value: the whole FieldInfo would carry model-only
+    # attributes (aliases, exclude, repr, ...) that TypeAdapter warns about
+    extras = list(field.metadata)
+    if field.discriminator is not None:
+        extras.append(Field(discriminator=field.discriminator))
+    tp = Annotated[(field.annotation, *extras)] if extras else field.annotation
+    cfg = {k: model_cls.model_config[k] for k in _ADAPTER_CONFIG_KEYS if k in model_cls.model_config}
+    try:
+        return TypeAdapter(tp, config=ConfigDict(**cfg) if cfg else None)
+    except PydanticUserError:
+        # model-typed fields carry their own config
+        return TypeAdapter(tp)
+
+
+def _validated_set(root: BaseModel, keys: Tuple[str, ...], value: Any) -> BaseModel | None:
+    """Return a copy of ``root`` with only the changed part re-validated.
+
+    The leaf is checked against its own field definition and spliced back in
+    with ``model_copy(update=...)`` along the path, so untouched siblings are
+    shared instead of re-validated. When a nested model on the path has a
+    validator that could observe the change, that model's subtree is
+    re-validated as a whole instead. Returns ``None`` when the path crosses a
+    non-model container or such a validator sits on the root model; the
+    caller must then rebuild the full model.
+    """
+    chain: List[Tuple[BaseModel, str]] = []
+    cur: Any = root
+    last = len(keys) - 1
+    for depth, key in enumerate(keys):
+        if not isinstance(cur, BaseModel):
+            return None
+        if depth < last and not _validators_touch(type(cur), key):
+            chain.append((cur, key))
+            cur = getattr(cur, key, None)
+            continue
+        adapter = _field_adapter(type(cur), key) if depth == last else None
+        if adapter is not None:
+            new = cur.model_copy(update={key: adapter.validate_python(value)})
+        elif chain:
+            # validators of ``cur`` may look at the change: rebuild its subtree
+            new = type(cur).model_validate(_deep_set_dict(cur, keys[depth:], value))
+        else:
+            return None
+        break
+
+    for parent, key in reversed(chain):
+        new = parent.model_copy(update={key: new})
+    return new
+
+
+# ---------- model copies ---------------------------------------------------- #
+
+_UnionType = getattr(types, "UnionType", Union)  # ``X | Y`` on Python 3.10+
+
+# leaf types whose values can be shared between model copies
+_IMMUTABLE_TYPES = (
+    bool, int, float, complex, str, bytes, type(None), Decimal, enum.Enum, PurePath,
+    datetime.date, datetime.time, datetime.timedelta,
+)
+
+
+def _is_immutable(ann: Any) -> bool:
+    origin = get_origin(ann)
+    if origin is Literal:
+        return True
+    if origin is Annotated:
+        return _is_immutable(get_args(ann)[0])
+    if origin in (Union, _UnionType, tuple, frozenset):
+        return all(a is Ellipsis or _is_immutable(a) for a in get_args(ann))
+    return isinstance(ann, type) and issubclass(ann, _IMMUTABLE_TYPES)
+
 
-    head, *tail = keys
+@lru_cache(maxsize=None)
+def _mutable_fields(model_cls: Type[BaseModel]) -> Tuple[str, ...]:
+    """Names of fields whose values may be mutated in place."""
 
-    if isinstance(data, BaseModel):
-        data = data.model_dump(mode="python")
+    return tuple(n for n, f in model_cls.model_fields.items() if not _is_immutable(f.annotation))
 
-    if data is None:
-        data = [] if head.isdigit() else {}
 
-    if isinstance(data, dict):
-        copied = {**data}
-        next_val = copied.get(head)
-        copied[head] = _deep_set_dict(next_val, tail, value)
-        return copied
+def _copy_model(model: BaseModel) -> BaseModel:
+    """Independent copy of ``model`` that deep-copies only mutable fields."""
 
-    if isinstance(data, list):
-        idx = int(head)
-        copied = list(data)
-        while len(copied) <= idx:
-            copied.append(None)
-        copied[idx] = _deep_set_dict(copied[idx], tail, value)
-        return copied
+    if model.__pydantic_extra__:
+        return model.model_copy(deep=True)
+    mutable = _mutable_fields(type(model))
+    if not mutable:
+        return model.model_copy()
+    update = {}
+    for n in mutable:
+        v = getattr(model, n)
+        update[n] = _copy_model(v) if isinstance(v, BaseModel) else copy.deepcopy(v)
+    return model.model_copy(update=update)
 
-    raise KeyError(f"Cannot traverse into {type(data)} with '{head}'.")
+
+def _detached(model: BaseModel) -> BaseModel:
+    """Return ``model`` for use as independent active state.
+
+    The root model is only ever replaced, never mutated in place, so it can be
+    shared as is when none of its fields holds a value that callers could
+    mutate through ``get_value`` (containers or nested models).
+    """
+    if not model.__pydantic_extra__ and not _mutable_fields(type(model)):
+        return model
+    return _copy_model(model)
+
+
+# ---------- trusted reload -------------------------------------------------- #
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _plain_json(ann: Any) -> bool:
+    """True if loaded JSON data is already a valid value for ``ann``."""
+    if ann is Any:
+        return True
+    origin = get_origin(ann)
+    if origin is Annotated:
+        return _plain_json(get_args(ann)[0])
+    if origin is Literal:
+        return all(isinstance(a, _JSON_SCALARS) and not isinstance(a, enum.Enum) for a in get_args(ann))
+    if origin in (Union, _UnionType, list, dict):
+        # model_construct does not recurse into containers, so models inside
+        # them would stay plain dicts
+        args = get_args(ann)
+        if origin is dict and args and args[0] is not str:
+            return False
+        return all(
+            _plain_json(a) and not (isinstance(a, type) and issubclass(a, BaseModel)) for a in args
+        )
+    if isinstance(ann, type) and issubclass(ann, BaseModel):
+        return _constructible(ann)
+    return ann in _JSON_SCALARS
+
+
+@lru_cache(maxsize=None)
+def _constructible(model_cls: Type[BaseModel]) -> bool:
+    """True if saved data for ``model_cls`` can be rebuilt by :func:`_construct`."""
+
+    return all(_plain_json(f.annotation) for f in model_cls.model_fields.values())
+
+
+def _construct(model_cls: Type[T], data: Any) -> T:
+    """Build ``model_cls`` from trusted saved data without validation."""
+    fields = model_cls.model_fields
+    if not isinstance(data, dict) or not data.keys() <= fields.keys():
+        raise TypeError(f"saved data does not match {model_cls.__name__}")
+    values = {}
+    for name, value in data.items():
+        ann = fields[name].annotation
+        if isinstance(ann, type) and issubclass(ann, BaseModel):
+            value = _construct(ann, value)
+        values[name] = value
+    return model_cls.model_construct(**values)
+
+
+def _checksum_path(path: Path) -> Path:
+    return path.with_name(path.name + ".sha256")
 
 
 # ---------- file I/O -------------------------------------------------------- #
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(data: Any) -> bytes:
+    # the writer _model_json uses: 4-space indent and NaN/inf as null, so
+    # save_as(), dcm-cli and persist() agree whether or not orjson is installed
+    return to_json(data, indent=4, inf_nan_mode="null")
+
 
 def _detect_format(path: Path) -> str:
     ext = path.suffix.lower().lstrip(".")
-    return {"yml": "yaml", "yaml": "yaml", "toml": "toml"}.get(ext, "json")
+    return {"yml": "yaml", "yaml": "yaml", "toml": "toml", "msgpack": "msgpack"}.get(ext, "json")
 
 
-def _load_file(path: Path, *, file_format: Optional[str] = None) -> Dict[str, Any]:
-    fmt = (file_format or _detect_format(path)).lower()
-    text = path.read_text(encoding="utf-8")
-    if fmt == "yaml":
+# Optional format modules, imported on first use and cached afterwards so the
+# hot save/load paths skip the import machinery.
+_yaml: Any = None
+_toml_reader: Any = None
+_toml_writer: Any = None
+_msgpack: Any = None
+
+
+def _get_yaml():
+    global _yaml
+    if _yaml is None:
         try:
             import yaml
         except ImportError as e:
             raise ImportError(
                 "YAML support requires PyYAML. Install with 'pip install dynamic-config-manager[yaml]'"
             ) from e
-        return yaml.safe_load(text) or {}
-    if fmt == "toml":
+        _yaml = yaml
+    return _yaml
+
+
+def _get_toml_reader():
+    global _toml_reader
+    if _toml_reader is None:
         try:
-            import tomli
+            import tomllib as reader  # stdlib on Python 3.11+
         except ImportError:
             try:
-                import tomllib as tomli
+                import tomli as reader
             except ImportError as e:
                 raise ImportError(
                     "TOML support requires tomli/tomllib. Install with 'pip install dynamic-config-manager[toml]'"
                 ) from e
-        return tomli.loads(text)
-    return json.loads(text)
+        _toml_reader = reader
+    return _toml_reader
 
 
-def _dump_file(path: Path, data: Dict[str, Any], *, file_format: Optional[str] = None):
-    fmt = (file_format or _detect_format(path)).lower()
-    if fmt == "yaml":
+def _get_toml_writer():
+    global _toml_writer
+    if _toml_writer is None:
         try:
-            import yaml
+            import tomli_w
         except ImportError as e:
             raise ImportError(
-                "YAML support requires PyYAML. Install with 'pip install dynamic-config-manager[yaml]'"
+                "TOML write support requires tomli-w. Install with 'pip install dynamic-config-manager[toml]'"
             ) from e
-        path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
-    elif fmt == "toml":
+        _toml_writer = tomli_w
+    return _toml_writer
+
+
+def _get_msgpack():
+    global _msgpack
+    if _msgpack is None:
         try:
-            import tomli_w
+            import msgspec.msgpack
         except ImportError as e:
             raise ImportError(
-                "TOML write support requires tomli-w. Install with 'pip install dynamic-config-manager[toml]'"
+                "MessagePack support requires msgspec. Install with 'pip install dynamic-config-manager[msgpack]'"
             ) from e
-        path.write_text(tomli_w.dumps(data), encoding="utf-8")
+        _msgpack = msgspec.msgpack
+    return _msgpack
+
+
+# larger files are parsed straight from a memory map instead of a bytes copy
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _load_file(path: Path, *, file_format: Optional[str] = None) -> Dict[str, Any]:
+    fmt = (file_format or _detect_format(path)).lower()
+    if fmt == "msgpack" or (fmt == "json" and orjson is not None):
+        # both decoders accept any buffer, so a mapped file works as input
+        decode = _get_msgpack().decode if fmt == "msgpack" else orjson.loads
+        if path.stat().st_size > _MMAP_THRESHOLD:
+            with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as buf:
+                return decode(buf)
+        return decode(path.read_bytes())
+    if fmt == "json":
+        return _json_loads(path.read_bytes())
+    if fmt == "yaml":
+        # PyYAML reads the stream in chunks; no full-file str is built
+        with path.open("rb") as f:
+            return _get_yaml().safe_load(f) or {}
+    text = path.read_text(encoding="utf-8")
+    if fmt == "toml":
+        return _get_toml_reader().loads(text)
+    return _json_loads(text)
+
+
+def _dump_file(path: Path, data: Dict[str, Any], *, file_format: Optional[str] = None):
+    fmt = (file_format or _detect_format(path)).lower()
+    if fmt == "yaml":
+        # the emitter writes into the file as it goes, no full-document str
+        payload = partial(_get_yaml().safe_dump, data, sort_keys=False, encoding="utf-8")
+    elif fmt == "toml":
+        payload = partial(_get_toml_writer().dump, data)
+    elif fmt == "msgpack":
+        payload = _get_msgpack().encode(data)
     else:  # json
-        path.write_text(
-            json.dumps(data, indent=4, ensure_ascii=False, default=to_jsonable_python),
-            encoding="utf-8",
-        )
+        payload = _json_dumps(data)
+    _atomic_write(path, payload)
+
+
+def _model_json(model: BaseModel) -> bytes:
+    # the model's compiled pydantic-core serializer emits bytes directly:
+    # no intermediate dict and no str -> bytes copy
+    return model.__pydantic_serializer__.to_json(model, indent=4)
+
+
+def _dump_model(path: Path, model: BaseModel, *, file_format: Optional[str] = None):
+    """Write ``model`` to ``path``; JSON skips the intermediate ``model_dump``."""
+    fmt = (file_format or _detect_format(path)).lower()
+    if fmt == "json":
+        _atomic_write(path, _model_json(model))
+    else:
+        _dump_file(path, model.model_dump(mode="json"), file_format=fmt)
+
+
+def _atomic_write(path: Path, payload: Union[bytes, Callable[[BinaryIO], Any]]) -> None:
+    """Write ``payload`` to a sibling temp file and move it over ``path``.
+
+    ``payload`` is either the encoded bytes or a callable that streams them
+    into the open binary file.
+
+    ``os.replace`` is atomic on POSIX and Windows, so readers (and the file
+    watcher) only ever see the previous or the complete new content. The
+    data is fsynced before the rename so a crash or power loss cannot leave
+    an empty file in place of the old one. The
+    temp name is unique per thread, so concurrent saves of one file cannot
+    collide, and it is created with the normal umask-derived permissions.
+    Missing parent directories are created on demand rather than checked
+    before every save.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        try:
+            f = open(tmp, "wb")
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            f = open(tmp, "wb")
+        with f:
+            if callable(payload):
+                payload(f)
+            else:
+                f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 # --------------------------------------------------------------------------- #
@@ -254,8 +636,32 @@ class ConfigInstance:
     ----------
     persistent : bool, default True
         If False the instance never touches the disk.
+    auto_save_delay : float, default 0.0
+        Seconds to coalesce ``auto_save`` writes for. ``0`` writes on every
+        change; a positive value debounces bursts of changes into one write.
     """
 
+    __slots__ = (
+        "name",
+        "_model_cls",
+        "_save_path",
+        "_auto_save",
+        "_persistent",
+        "_auto_save_delay",
+        "_trusted_reload",
+        "_dirty",
+        "_flush_timer",
+        "_init_lock",
+        "_save_lock",
+        "_defaults_model",
+        "_active_model",
+        "_value_cache",
+        "_disk_cache",
+        "_dump_cache",
+        "_saved_state",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         *,
@@ -264,15 +670,84 @@ class ConfigInstance:
         save_path: Path | None,
         auto_save: bool,
         persistent: bool = True,
+        auto_save_delay: float = 0.0,
+        trusted_reload: bool = False,
     ):
         self.name = name
         self._model_cls: Type[T] = model_cls
         self._save_path: Path | None = save_path if persistent else None
         self._auto_save = auto_save and persistent
         self._persistent = persistent
+        self._auto_save_delay = auto_save_delay
+        # skip validation when reloading a file this instance wrote itself
+        self._trusted_reload = trusted_reload
+        self._dirty = False
+        self._flush_timer: threading.Timer | None = None
+
+        # models are built on first use, so unused configs cost no validation
+        self._init_lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._defaults_model: T = _UNSET
+        self._active_model: T = _UNSET
+        # dotted path -> value of the current active model
+        self._value_cache: Dict[str, Any] = {}
+        # (st_mtime_ns, st_size, model) of the last read-only load from disk
+        self._disk_cache: Tuple[int, int, T] | None = None
+        # (active model, its python-mode dump) for full-model rebuilds
+        self._dump_cache: Tuple[T, Dict[str, Any]] | None = None
+        # (payload digest, st_mtime_ns, st_size) of the JSON file as last
+        # written or read, so identical saves can skip the write
+        self._saved_state: Tuple[bytes, int, int] | None = None
+
+    # ------------ lazy state ------------------------------------------- #
+
+    @property
+    def _defaults(self) -> T:
+        if self._defaults_model is _UNSET:
+            with self._init_lock:
+                self._build_defaults()
+        return self._defaults_model
 
-        self._defaults: T = self._model_cls()
-        self._active: T = self._load_from_disk() or self._defaults.model_copy(deep=True)
+    @_defaults.setter
+    def _defaults(self, model: T) -> None:
+        self._defaults_model = model
+
+    @property
+    def _active(self) -> T:
+        if self._active_model is _UNSET:
+            self._ensure_loaded()
+        return self._active_model
+
+    @_active.setter
+    def _active(self, model: T) -> None:
+        self._active_model = model
+        # swap rather than clear so concurrent readers fill the old dict
+        self._value_cache = {}
+
+    def _active_dump(self) -> Dict[str, Any]:
+        """``model_dump`` of the active model, reused until it is replaced.
+
+        Callers must not mutate the result; :func:`_deep_set_dict` copies the
+        containers along the written path and shares the rest.
+        """
+        active = self._active
+        cache = self._dump_cache
+        if cache is None or cache[0] is not active:
+            cache = self._dump_cache = (active, active.model_dump(mode="python"))
+        return cache[1]
+
+    def _build_defaults(self) -> T:
+        # caller holds _init_lock
+        if self._defaults_model is _UNSET:
+            self._defaults_model = self._model_cls()
+        return self._defaults_model
+
+    def _ensure_loaded(self) -> None:
+        with self._init_lock:
+            if self._active_model is _UNSET:
+                disk = self._load_from_disk()
+                # defaults are only built when there is no usable file
+                self._active_model = disk if disk is not None else _detached(self._build_defaults())
 
     # ------------ public (value access) -------------------------------- #
 
@@ -290,25 +765,35 @@ class ConfigInstance:
 
     @property
     def saved(self) -> _SavedAccessorProxy[T]:
-        return _SavedAccessorProxy(self)
+        return _SavedAccessorProxy(self._load_from_disk(cached=True))
 
     # alias for convenience
     file = saved
 
     def get_value(self, path: str, default: Any | None = None) -> Any:
+        cache = self._value_cache
         try:
-            return _deep_get(self._active, path.split("."))
-        except Exception:
+            return cache[path]
+        except KeyError:
+            pass
+        # load outside the try: a bad file or model must raise, not read as missing
+        model = self._active
+        try:
+            val = _path_getter(self._model_cls, path)(model)
+        except _LOOKUP_ERRORS:
             return default
+        cache[path] = val
+        return val
 
     # aliases for convenience
     get = get_value
     get_active = get_value
 
     def get_default(self, path: str, default: Any | None = None) -> Any:
+        model = self._defaults
         try:
-            return _deep_get(self._defaults, path.split("."))
-        except Exception:
+            return _path_getter(self._model_cls, path)(model)
+        except _LOOKUP_ERRORS:
             return default
 
     def get_saved(self, path: str, default: Any | None = None) -> Any:
@@ -316,100 +801,130 @@ class ConfigInstance:
         return default if val is PydanticUndefined else val
 
     def set_value(self, path: str, value: Any):
-        meta = self.get_metadata(path)
-        if meta.get("editable") is False:
-            raise PermissionError(f"Field '{path}' is not editable.")
+        keys, value = self._prepare_write(path, value)
+        current = self.get_value(path, _UNSET)
+        # writing back an equal value is a no-op, unless it is the live
+        # container itself, which the caller may have mutated in place
+        if (
+            type(current) is type(value)
+            and current == value
+            and (current is not value or _is_immutable(type(value)))
+        ):
+            return
+        try:
+            # always a new root model: _active may be shared with _defaults
+            new_active = _validated_set(self._active, keys, value)
+            if new_active is None:
+                raw = _deep_set_dict(self._active_dump(), keys, value)
+                new_active = self._model_cls(**raw)
+            self._active = new_active
+        except ValidationError as e:
+            raise ValueError(f"Validation failed setting '{path}':\n{e}") from e
+
+        self._mark_dirty()
+
+    def set_values(self, values: Dict[str, Any]):
+        """Set several dotted paths at once with a single model validation.
 
+        Either every value is applied or, if validation fails, none is.
+        """
+        if len(values) == 1:
+            ((path, value),) = values.items()
+            return self.set_value(path, value)
+        writes = [self._prepare_write(path, value) for path, value in values.items()]
+        if not writes:
+            return
+        # the dump is a private copy, so every write can go in place
+        raw = self._active.model_dump(mode="python")
+        for keys, value in writes:
+            raw = _deep_set_dict(raw, keys, value, in_place=True)
         try:
-            low = meta.get("ge") if meta.get("ge") is not None else meta.get("gt")
-            high = meta.get("le") if meta.get("le") is not None else meta.get("lt")
-            if (low is not None or high is not None) and isinstance(value, (int, float)):
-                if low is not None and value < low:
-                    value = low
-                if high is not None and value > high:
-                    value = high
-
-            raw = _deep_set_dict(self._active, path.split("."), value)
             self._active = self._model_cls(**raw)
         except ValidationError as e:
-            raise ValueError(f"Validation failed setting '{path}':\n{e}") from e
+            raise ValueError(f"Validation failed setting {', '.join(values)}:\n{e}") from e
 
-        if self._auto_save:
-            self.persist()
+        self._mark_dirty()
+
+    @contextmanager
+    def batch_update(self):
+        """Suspend auto-save for the block; save once on exit if anything changed."""
+        if not self._auto_save:  # nothing to defer, or already inside bulk()
+            yield self
+            return
+        self._auto_save = False
+        try:
+            yield self
+        finally:
+            self._auto_save = True
+            if self._dirty:
+                self.persist()
+
+    def _prepare_write(self, path: str, value: Any) -> Tuple[Tuple[str, ...], Any]:
+        """Check that ``path`` may be written and apply its numeric clamp."""
+        keys = _split_path(path)
+        try:
+            _field, meta, _extra = _resolve_field(self._model_cls, keys)
+        except KeyError:
+            # paths into list/dict values have no FieldInfo of their own
+            if isinstance(_deep_get(self._active, keys[:-1]), BaseModel):
+                raise
+            meta = {}
+        if meta.get("editable") is False:
+            raise PermissionError(f"Field '{path}' is not editable.")
+
+        clamp = _clamp_table(self._model_cls).get(keys)
+        if clamp is not None:
+            value = clamp(value)
+        return keys, value
 
     # ------------ metadata -------------------------------------------- #
 
-    def get_metadata(self, path: str, default: Any | None = None) -> Dict[str, Any] | Any:
-        try:
-            keys = path.split(".")
-            cur_model: Union[Type[BaseModel], BaseModel] = self._model_cls
-            for idx, k in enumerate(keys):
-                if not hasattr(cur_model, "model_fields"):
-                    raise KeyError(path)
-                field = cur_model.model_fields.get(k)
-                if field is None:
-                    raise KeyError(k)
-                if idx < len(keys) - 1:
-                    cur_model = field.annotation
-
-            active_val = _deep_get(self._active, keys)
-            default_val = _deep_get(self._defaults, keys)
-
-            meta = {
-                "type": field.annotation,
-                "required": field.is_required(),
-                "default": field.default,
-                "description": field.description,
-                "editable": (field.json_schema_extra or {}).get("editable", True),
-                **_extract_constraints(field),
-                "active_value": active_val,
-                "default_value": default_val,
-            }
-
-            # Include full json_schema_extra content
-            if field.json_schema_extra:
-                meta["json_schema_extra"] = field.json_schema_extra.copy()
-                
-                # Flatten common ConfigField attributes for convenience
-                common_attrs = ["ui_hint", "ui_extra", "options", "format_spec"]
-                for attr in common_attrs:
-                    if attr in field.json_schema_extra:
-                        meta[attr] = field.json_schema_extra[attr]
-                
-                # Handle autofix_settings (stored as "autofix" in json_schema_extra)
-                if "autofix" in field.json_schema_extra:
-                    meta["autofix_settings"] = field.json_schema_extra["autofix"]
+    def get_metadata(
+        self, path: str, default: Any | None = None, *, include_saved: bool = True
+    ) -> Dict[str, Any] | Any:
+        """Describe the field at ``path``; ``default`` if it does not exist.
 
-            saved_val = PydanticUndefined
-            if self._save_path and self._save_path.exists():
-                disk = self._load_from_disk()
-                if disk is not None:
-                    try:
-                        saved_val = _deep_get(disk, keys)
-                    except Exception:
-                        saved_val = PydanticUndefined
-
-            meta["saved_value"] = saved_val
-            return meta
-        except Exception:
+        With ``include_saved=False`` the saved file is not consulted and
+        ``saved_value`` is ``PydanticUndefined``.
+        """
+        keys = _split_path(path)
+        active, defaults = self._active, self._defaults
+        try:
+            _field, head, tail = _resolve_field(self._model_cls, keys)
+            active_value = _deep_get(active, keys)
+            default_value = _deep_get(defaults, keys)
+        except _LOOKUP_ERRORS:
             return default
 
+        meta = {**head, "active_value": active_value, "default_value": default_value, **tail}
+        if "json_schema_extra" in meta:
+            # hand out a copy so callers cannot mutate the cached schema
+            meta["json_schema_extra"] = meta["json_schema_extra"].copy()
+
+        meta["saved_value"] = self._get_saved_value(path) if include_saved else PydanticUndefined
+        return meta
+
     # ------------ restore helpers ------------------------------------- #
 
     def restore_value(self, path: str, source: str = "default"):
         if source == "default":
-            new_val = _deep_get(self._defaults, path.split("."))
+            new_val = _deep_get(self._defaults, _split_path(path))
         elif source == "file":
-            disk = self._load_from_disk() or self._defaults
-            new_val = _deep_get(disk, path.split("."))
+            disk = self._load_from_disk(cached=True) or self._defaults
+            new_val = _deep_get(disk, _split_path(path))
         else:
             raise ValueError("source must be 'default' or 'file'")
+        # validation hands models back as the same object: never let the
+        # active state alias the defaults or the cached file snapshot
+        if isinstance(new_val, BaseModel):
+            new_val = _copy_model(new_val)
+        elif not _is_immutable(type(new_val)):
+            new_val = copy.deepcopy(new_val)
         self.set_value(path, new_val)
 
     def restore_defaults(self):
-        self._active = self._defaults.model_copy(deep=True)
-        if self._auto_save:
-            self.persist()
+        self._active = _detached(self._defaults)
+        self._mark_dirty()
 
     # ------------ persistence ----------------------------------------- #
 
@@ -417,18 +932,40 @@ class ConfigInstance:
         if not self._save_path:
             log.debug("Config '%s' is memory‑only; nothing persisted.", self.name)
             return False
-        try:
-            self._save_path.parent.mkdir(parents=True, exist_ok=True)
-            _dump_file(
-                self._save_path,
-                self._active.model_dump(mode="json"),
-                file_format=file_format,
-            )
-            log.info("Config '%s' saved to %s", self.name, self._save_path)
-            return True
-        except Exception as exc:
-            log.warning("Could not save '%s': %s", self.name, exc, exc_info=True)
-            return False
+        # serialise writers (debounce timer, save_all pool, callers) so an
+        # older snapshot can never replace a newer one on disk
+        with self._save_lock:
+            self._cancel_flush()
+            self._dirty = False
+            try:
+                fmt = (file_format or _detect_format(self._save_path)).lower()
+                if fmt == "json":
+                    payload = _model_json(self._active)
+                    digest = hashlib.blake2b(payload, digest_size=16).digest()
+                    if self._unchanged_on_disk(digest):
+                        log.debug("Config '%s' unchanged; not rewriting %s", self.name, self._save_path)
+                        return True
+                    self._disk_cache = None
+                    _atomic_write(self._save_path, payload)
+                    self._remember_saved(digest)
+                else:
+                    payload = None
+                    self._disk_cache = None
+                    self._saved_state = None
+                    _dump_model(self._save_path, self._active, file_format=fmt)
+                if self._trusted_reload:
+                    if payload is None:
+                        payload = self._save_path.read_bytes()
+                    _atomic_write(
+                        _checksum_path(self._save_path),
+                        hashlib.sha256(payload).hexdigest().encode(),
+                    )
+                log.info("Config '%s' saved to %s", self.name, self._save_path)
+                return True
+            except Exception as exc:
+                self._dirty = True
+                log.warning("Could not save '%s': %s", self.name, exc, exc_info=True)
+                return False
 
     save = persist  # alias
 
@@ -437,24 +974,95 @@ class ConfigInstance:
     ) -> bool:
         path = Path(path).expanduser().resolve()
         try:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            _dump_file(
-                path, self._active.model_dump(mode="json"), file_format=file_format
-            )
+            _dump_model(path, self._active, file_format=file_format)
             log.info("Config '%s' exported to %s", self.name, path)
             return True
         except Exception as exc:
             log.warning("Export failed: %s", exc, exc_info=True)
             return False
 
+    def flush(self) -> bool:
+        """Write a pending debounced auto-save now; ``True`` if one was written."""
+        self._cancel_flush()
+        if self._dirty and self._auto_save:
+            return self.persist()
+        return False
+
     # ------------ internal ------------------------------------------- #
 
-    def _load_from_disk(self) -> T | None:
-        if not (self._save_path and self._save_path.exists()):
+    def _needs_save(self) -> bool:
+        """True if the file is missing or older than the in-memory state."""
+        if self._save_path is None:
+            return False
+        return self._dirty or not self._save_path.exists()
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        if not self._auto_save:
+            return
+        if self._auto_save_delay <= 0:
+            self.persist()
+            return
+        self._cancel_flush()
+        timer = threading.Timer(self._auto_save_delay, self.flush)
+        timer.daemon = True
+        self._flush_timer = timer
+        timer.start()
+
+    def _cancel_flush(self) -> None:
+        timer, self._flush_timer = self._flush_timer, None
+        if timer is not None:
+            timer.cancel()
+
+    def _unchanged_on_disk(self, digest: bytes) -> bool:
+        """True if the file still holds the payload hashed to ``digest``."""
+        state = self._saved_state
+        if state is None or state[0] != digest:
+            return False
+        try:
+            st = self._save_path.stat()
+        except OSError:
+            return False
+        return state[1:] == (st.st_mtime_ns, st.st_size)
+
+    def _remember_saved(self, digest: bytes) -> None:
+        try:
+            st = self._save_path.stat()
+        except OSError:
+            self._saved_state = None
+        else:
+            self._saved_state = (digest, st.st_mtime_ns, st.st_size)
+
+    def _load_from_disk(self, *, cached: bool = False) -> T | None:
+        """Parse the saved file into a model, or return ``None``.
+
+        With ``cached=True`` the parsed model is reused while the file's
+        mtime and size are unchanged. Such results are shared, so only
+        read-only callers may request them.
+        """
+        if not self._save_path:
+            return None
+        try:
+            st = self._save_path.stat()
+        except OSError:
+            self._disk_cache = None
             return None
+        sig = (st.st_mtime_ns, st.st_size)
+        entry = self._disk_cache
+        if cached and entry is not None and entry[:2] == sig:
+            return entry[2]
         try:
-            data = _load_file(self._save_path)
-            return self._model_cls(**data)
+            model = self._load_trusted() if self._trusted_reload else None
+            if model is None and _detect_format(self._save_path) == "json":
+                raw = self._save_path.read_bytes()
+                model = self._model_cls.model_validate_json(raw)
+                self._saved_state = (hashlib.blake2b(raw, digest_size=16).digest(), *sig)
+            elif model is None:
+                data = _load_file(self._save_path)
+                model = self._model_cls(**data)
+            if cached:
+                self._disk_cache = (*sig, model)
+            return model
         except (ValidationError, json.JSONDecodeError, ValueError, TypeError) as e:
             log.warning(
                 "Bad data in %s for '%s'; using defaults.  (%s)",
@@ -464,6 +1072,29 @@ class ConfigInstance:
             )
             return None
 
+    def _load_trusted(self) -> T | None:
+        """Build the model from the saved file without validation.
+
+        Only used when the file still matches the checksum written next to it
+        by :meth:`persist`; otherwise ``None`` is returned and the caller
+        validates as usual.
+        """
+        if not _constructible(self._model_cls):
+            return None
+        try:
+            expected = _checksum_path(self._save_path).read_bytes().strip()
+        except OSError:
+            return None
+        raw = self._save_path.read_bytes()
+        if hashlib.sha256(raw).hexdigest().encode() != expected:
+            return None
+        fmt = _detect_format(self._save_path)
+        data = _json_loads(raw) if fmt == "json" else _load_file(self._save_path, file_format=fmt)
+        try:
+            return _construct(self._model_cls, data)
+        except (TypeError, AttributeError):
+            return None
+
     def get_field_names(self, path: str = "") -> List[str]:
         """
         Get all registered field names, optionally scoped to a nested path.
@@ -478,10 +1109,10 @@ class ConfigInstance:
         """
         if not path:
             # Return all field names from root
-            return _collect_field_names(self._model_cls)
+            return list(_field_names(self._model_cls))
         
         # Validate path and get the target model class
-        keys = path.split(".")
+        keys = _split_path(path)
         cur_model: Union[Type[BaseModel], BaseModel] = self._model_cls
         
         for idx, k in enumerate(keys):
@@ -504,18 +1135,18 @@ class ConfigInstance:
                 cur_model = field.annotation
         
         # Collect field names from the target model
-        return _collect_field_names(cur_model)
+        return list(_field_names(cur_model))
 
     def _get_saved_value(self, path: str) -> Any:
         """Return value from the persisted file or ``PydanticUndefined``."""
-        keys = path.split(".")
-        if self._save_path and self._save_path.exists():
-            disk = self._load_from_disk()
-            if disk is not None:
-                try:
-                    return _deep_get(disk, keys)
-                except Exception:
-                    pass
+        if self._save_path is None:  # memory-only: nothing on disk to consult
+            return PydanticUndefined
+        disk = self._load_from_disk(cached=True)
+        if disk is not None:
+            try:
+                return _deep_get(disk, _split_path(path))
+            except _LOOKUP_ERRORS:
+                pass
         return PydanticUndefined
 
 
@@ -553,19 +1184,135 @@ def _collect_field_names(model_cls: Type[BaseModel], prefix: str = "") -> List[s
     return field_names
 
 
+@lru_cache(maxsize=None)
+def _field_names(model_cls: Type[BaseModel]) -> Tuple[str, ...]:
+    """Memoised :func:`_collect_field_names`; callers get a fresh list each time."""
+
+    return tuple(_collect_field_names(model_cls))
+
+
+@lru_cache(maxsize=None)
+def _field_table(
+    model_cls: Type[BaseModel],
+) -> Dict[Tuple[str, ...], Tuple[FieldInfo, Dict[str, Any], Dict[str, Any]]]:
+    """Map every field path of ``model_cls`` to ``(field, head, tail)``.
+
+    ``head`` holds the schema entries that precede the live values in
+    :meth:`ConfigInstance.get_metadata` and ``tail`` the ``json_schema_extra``
+    derived entries. The table is built in one walk per model class; model
+    classes are never mutated in place, so it stays valid for the process
+    lifetime.
+    """
+    table: Dict[Tuple[str, ...], Tuple[FieldInfo, Dict[str, Any], Dict[str, Any]]] = {}
+
+    def walk(cls: Type[BaseModel], prefix: Tuple[str, ...], seen: frozenset) -> None:
+        for name, field in cls.model_fields.items():
+            keys = prefix + (name,)
+            table[keys] = (field, *_field_meta(field))
+            ann = field.annotation
+            if hasattr(ann, "model_fields") and ann not in seen:
+                walk(ann, keys, seen | {ann})
+
+    walk(model_cls, (), frozenset({model_cls}))
+    return table
+
+
+def _resolve_field(
+    model_cls: Type[BaseModel], keys: Tuple[str, ...]
+) -> Tuple[FieldInfo, Dict[str, Any], Dict[str, Any]]:
+    """Return the precomputed ``(field, head, tail)`` entry for ``keys``."""
+    try:
+        return _field_table(model_cls)[keys]
+    except KeyError:
+        raise KeyError(".".join(keys)) from None
+
+
+@lru_cache(maxsize=None)
+def _clamp_table(model_cls: Type[BaseModel]) -> Dict[Tuple[str, ...], Callable[[Any], Any]]:
+    """Map field paths with numeric bounds to a function clamping into them."""
+    table = {}
+    for keys, (_field, head, _tail) in _field_table(model_cls).items():
+        low = head.get("ge") if head.get("ge") is not None else head.get("gt")
+        high = head.get("le") if head.get("le") is not None else head.get("lt")
+        if low is not None or high is not None:
+            table[keys] = _make_clamp(low, high)
+    return table
+
+
+def _make_clamp(low: Any, high: Any) -> Callable[[Any], Any]:
+    def clamp(value: Any) -> Any:
+        if isinstance(value, (int, float)):
+            if low is not None and value < low:
+                value = low
+            if high is not None and value > high:
+                value = high
+        return value
+
+    return clamp
+
+
+def _field_meta(field: FieldInfo) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    # callable json_schema_extra only customises the JSON schema
+    extra = field.json_schema_extra if isinstance(field.json_schema_extra, dict) else None
+    head = {
+        "type": field.annotation,
+        "required": field.is_required(),
+        "default": field.default,
+        "description": field.description,
+        "editable": (extra or {}).get("editable", True),
+        **_extract_constraints(field),
+    }
+
+    tail: Dict[str, Any] = {}
+    # Include full json_schema_extra content
+    if extra:
+        tail["json_schema_extra"] = extra.copy()
+
+        # Flatten common ConfigField attributes for convenience
+        for attr in ("ui_hint", "ui_extra", "options", "format_spec"):
+            if attr in extra:
+                tail[attr] = extra[attr]
+
+        # Handle autofix_settings (stored as "autofix" in json_schema_extra)
+        if "autofix" in extra:
+            tail["autofix_settings"] = extra["autofix"]
+
+    return head, tail
+
+
+def _clear_schema_caches() -> None:
+    """Forget everything memoised per model class."""
+    for cached in (
+        _field_names, _field_table, _clamp_table, _validators_touch, _field_adapter, _mutable_fields,
+        _constructible, _path_getter,
+    ):
+        cached.cache_clear()
+
+
+_CONSTRAINT_ATTRS = ("ge", "gt", "le", "lt", "min_length", "max_length", "pattern", "multiple_of")
+
+# annotated_types metadata classes carry exactly one constraint each
+_CONSTRAINT_BY_TYPE = {
+    annotated_types.Ge: "ge",
+    annotated_types.Gt: "gt",
+    annotated_types.Le: "le",
+    annotated_types.Lt: "lt",
+    annotated_types.MinLen: "min_length",
+    annotated_types.MaxLen: "max_length",
+    annotated_types.MultipleOf: "multiple_of",
+}
+
+
 def _extract_constraints(field) -> Dict[str, Any]:
     out: Dict[str, Any] = {}
     for meta in getattr(field, "metadata", ()):
-        for attr in (
-            "ge",
-            "gt",
-            "le",
-            "lt",
-            "min_length",
-            "max_length",
-            "pattern",
-            "multiple_of",
-        ):
+        attr = _CONSTRAINT_BY_TYPE.get(type(meta))
+        if attr is not None:
+            if (val := getattr(meta, attr)) is not None:
+                out[attr] = val
+            continue
+        # other metadata (Interval, pydantic's general metadata, ...)
+        for attr in _CONSTRAINT_ATTRS:
             if (val := getattr(meta, attr, None)) is not None:
                 out[attr] = val
     return out
@@ -585,10 +1332,14 @@ class _ConfigManagerInternal:
       to persist every *subsequent* config there (unless it passes its own ``save_path``).
     """
 
+    __slots__ = ("_instances", "_default_dir")
+
     def __init__(self):
         self._instances: Dict[str, ConfigInstance] = {}
         self._default_dir: Path = Path(tempfile.gettempdir()) / "dynamic_config_manager"
         self._default_dir.mkdir(parents=True, exist_ok=True)
+        # debounce timers are daemon threads; land their pending writes at exit
+        atexit.register(self.flush)
 
     # ---------- registration ------------------------------------------ #
 
@@ -600,6 +1351,8 @@ class _ConfigManagerInternal:
         save_path: str | os.PathLike | None = None,
         auto_save: bool = False,
         persistent: bool = True,
+        auto_save_delay: float = 0.0,
+        trusted_reload: bool = False,
     ) -> ConfigInstance:
         if name in self._instances:
             raise ValueError(f"Config '{name}' already registered.")
@@ -613,6 +1366,8 @@ class _ConfigManagerInternal:
             save_path=resolved_path,
             auto_save=auto_save,
             persistent=persistent,
+            auto_save_delay=auto_save_delay,
+            trusted_reload=trusted_reload,
         )
         self._instances[name] = inst
         return inst
@@ -639,13 +1394,45 @@ class _ConfigManagerInternal:
     def __iter__(self):
         return iter(self._instances.values())
 
-    def save_all(self):
-        for inst in self._instances.values():
-            inst.persist()
+    def save_all(self, *, force: bool = False) -> Dict[str, bool]:
+        """Persist every instance with unsaved changes, writing in a thread pool.
+
+        Instances whose file is already up to date are skipped unless
+        ``force`` is true. Returns ``{name: saved}`` for the instances written.
+        """
+        instances = [inst for inst in self._instances.values() if force or inst._needs_save()]
+        return self._persist_many(instances)
+
+    @staticmethod
+    def _persist_many(instances: List[ConfigInstance]) -> Dict[str, bool]:
+        if len(instances) <= 1:
+            return {inst.name: inst.persist() for inst in instances}
+        with ThreadPoolExecutor(max_workers=min(32, len(instances))) as pool:
+            return dict(pool.map(lambda inst: (inst.name, inst.persist()), instances))
+
+    @contextmanager
+    def bulk(self):
+        """Suspend auto-save for the block; write each changed config once on exit."""
+        suspended = [inst for inst in self._instances.values() if inst._auto_save]
+        for inst in suspended:
+            inst._auto_save = False
+        try:
+            yield self
+        finally:
+            for inst in suspended:
+                inst._auto_save = True
+            self._persist_many([inst for inst in suspended if inst._dirty])
 
     def restore_all_defaults(self):
+        # the auto-saves are collected and written concurrently on exit
+        with self.bulk():
+            for inst in self._instances.values():
+                inst.restore_defaults()
+
+    def flush(self):
+        """Write every pending debounced auto-save, e.g. before shutdown."""
         for inst in self._instances.values():
-            inst.restore_defaults()
+            inst.flush()
 
     def update_model_field(
         self,
@@ -659,9 +1446,9 @@ class _ConfigManagerInternal:
         from pydantic.fields import FieldInfo
 
         inst = self._instances[config_name]
-        parts = field_path.split(".")
+        parts = _split_path(field_path)
 
-        def _rebuild(model_cls: Type[BaseModel], keys: List[str]) -> Type[BaseModel]:
+        def _rebuild(model_cls: Type[BaseModel], keys: Sequence[str]) -> Type[BaseModel]:
             name = keys[0]
             field = model_cls.model_fields[name]
             if len(keys) == 1:
@@ -696,6 +1483,10 @@ class _ConfigManagerInternal:
         inst._model_cls = candidate_cls
         inst._active = new_active
         inst._defaults = candidate_cls()
+        inst._disk_cache = None
+        inst._dirty = True
+        # drop per-class entries that would otherwise pin the replaced classes
+        _clear_schema_caches()
         return True
 
     # ---------- helpers ----------------------------------------------- #
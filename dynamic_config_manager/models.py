@@ -1,6 +1,9 @@
 """
 General-purpose Pydantic model definitions for common configuration structures.
 These serve as examples or base models for users of the dynamic-config-manager.
+
+Each model sets ``defer_build=True`` so importing this module does not build
+validators and serializers for models the application never uses.
 """
 
 from typing import List, Dict, Any, Optional, Literal
@@ -18,7 +21,7 @@ from pydantic import (
     PositiveInt,
     BaseModel, # Use BaseModel for nested structures not needing BaseSettings features
 )
-from pydantic_settings import *
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # --- General Application Settings ---
 
@@ -51,6 +54,7 @@ class GeneralAppSettings(BaseSettings):
 
     model_config = SettingsConfigDict(
         extra='ignore',
+        defer_build=True, # Build validators on first use, not at import
         # Example: Allow loading 'LOG_LEVEL' env var for log_level field
         # env_prefix='MYAPP_' # Optional prefix for environment variables
     )
@@ -79,7 +83,7 @@ class UISettings(BaseSettings):
         json_schema_extra={'ui_hint': 'checkbox', 'editable': True}
     )
 
-    model_config = SettingsConfigDict(extra='ignore')
+    model_config = SettingsConfigDict(extra='ignore', defer_build=True)
 
 # --- Database Connection Settings ---
 
@@ -111,7 +115,7 @@ class DatabaseSettings(BaseSettings):
         json_schema_extra={'ui_hint': 'checkbox', 'editable': True}
     )
 
-    model_config = SettingsConfigDict(extra='ignore')
+    model_config = SettingsConfigDict(extra='ignore', defer_build=True)
 
 # --- External API Settings ---
 
@@ -138,7 +142,7 @@ class APISettings(BaseSettings):
         json_schema_extra={'ui_hint': 'spinbox', 'step': 1, 'editable': True}
     )
 
-    model_config = SettingsConfigDict(extra='ignore')
+    model_config = SettingsConfigDict(extra='ignore', defer_build=True)
 
 # --- File Path Settings ---
 
@@ -164,7 +168,7 @@ class PathSettings(BaseSettings):
     # Make validation optional if paths might not exist yet:
     # model_config = SettingsConfigDict(extra='ignore', validate_assignment=False)
     # Or handle validation errors in the app.
-    model_config = SettingsConfigDict(extra='ignore')
+    model_config = SettingsConfigDict(extra='ignore', defer_build=True)
 
     # Example validator to ensure output dir exists or can be created
     @model_validator(mode='after')
@@ -207,7 +211,7 @@ class FileLoggingSettings(BaseSettings):
         json_schema_extra={'ui_hint': 'textarea', 'editable': True}
     )
 
-    model_config = SettingsConfigDict(extra='ignore')
+    model_config = SettingsConfigDict(extra='ignore', defer_build=True)
 
 
 # --- Feature Flag Settings ---
@@ -228,7 +232,7 @@ class FeatureFlagSettings(BaseSettings):
     # enable_new_dashboard: bool = Field(default=False, description="...")
     # enable_experimental_import: bool = Field(default=False, description="...")
 
-    model_config = SettingsConfigDict(extra='ignore')
+    model_config = SettingsConfigDict(extra='ignore', defer_build=True)
 
 # --- Add more general-purpose models as needed ---
 # E.g., UserProfileSettings, PluginSettings, ThemeCustomizationSettings, etc.
@@ -49,13 +49,22 @@ import ast
 import operator as _op
 from difflib import get_close_matches
 from enum import Enum
-from typing import Any
+from functools import lru_cache, partial
+from typing import Any, Callable
 import math
+import weakref
 from pathlib import Path
 
 from pydantic import BaseModel, model_validator
 from pydantic.fields import FieldInfo
 
+from .manager import _extract_constraints
+
+try:  # optional C++ string matching for the options fallback
+    from rapidfuzz import fuzz as _fuzz, process as _fuzz_process
+except ImportError:  # pragma: no cover - optional dependency
+    _fuzz = _fuzz_process = None
+
 # ------------------------------------------------------------------
 # enums / policy helpers
 # ------------------------------------------------------------------
@@ -132,6 +141,7 @@ _SAFE_NAMES = {
     "e": math.e,
     "__builtins__": {},
 }
+_NUMBER_TYPES = (int, float)
 _SAFE_BIN_OPS = {
     ast.Add: _op.add,
     ast.Sub: _op.sub,
@@ -146,44 +156,78 @@ _SAFE_BIN_OPS = {
 # internal helpers
 # ------------------------------------------------------------------
 
-def _safe_eval(expr: str, names: dict[str, Any]) -> float | None:
-    """Very small safe-eval for arithmetic expressions used in strings."""
-
-    def _eval(node):
-        if isinstance(node, ast.Constant):
-            return node.value
-        if isinstance(node, ast.Num):  # type: ignore[attr-defined]
-            return node.n
-        if isinstance(node, ast.Name):
-            return names.get(node.id)
-        if isinstance(node, ast.BinOp) and type(node.op) in _SAFE_BIN_OPS:
-            return _SAFE_BIN_OPS[type(node.op)](_eval(node.left), _eval(node.right))
-        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
-            return -_eval(node.operand)
-        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
-            func = _SAFE_NAMES.get(node.func.id)
-            if func is None:
-                raise ValueError("unsafe call")
-            args = [_eval(a) for a in node.args]
-            return func(*args)
-        raise ValueError("unsafe expression")
+# names bound per call; every other name resolves from _SAFE_NAMES at compile time
+_EXPR_ARGS = {
+    "v": lambda v, mn, mx: v,
+    "x": lambda v, mn, mx: v,
+    "min": lambda v, mn, mx: mn,
+    "max": lambda v, mn, mx: mx,
+}
 
+
+def _compile_node(node: ast.AST) -> Callable[[Any, Any, Any], Any]:
+    """Turn one whitelisted AST node into a closure over ``(v, mn, mx)``."""
+    if isinstance(node, ast.Constant):
+        value = node.value
+        return lambda v, mn, mx: value
+    if isinstance(node, ast.Name):
+        arg = _EXPR_ARGS.get(node.id)
+        if arg is not None:
+            return arg
+        value = _SAFE_NAMES.get(node.id)
+        return lambda v, mn, mx: value
+    if isinstance(node, ast.BinOp) and type(node.op) in _SAFE_BIN_OPS:
+        op = _SAFE_BIN_OPS[type(node.op)]
+        left, right = _compile_node(node.left), _compile_node(node.right)
+        return lambda v, mn, mx: op(left(v, mn, mx), right(v, mn, mx))
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        operand = _compile_node(node.operand)
+        return lambda v, mn, mx: -operand(v, mn, mx)
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+        func = _SAFE_NAMES.get(node.func.id)
+        if func is None:
+            raise ValueError("unsafe call")
+        args = tuple(_compile_node(a) for a in node.args)
+        return lambda v, mn, mx: func(*(a(v, mn, mx) for a in args))
+    raise ValueError("unsafe expression")
+
+
+@lru_cache(maxsize=512)
+def _compile_expr(expr: str) -> Callable[[Any, Any, Any], Any] | None:
+    """Parse and compile ``expr`` once; ``None`` if it is not a safe expression."""
     try:
-        parsed = ast.parse(expr.replace("^", "**"), mode="eval").body  # type: ignore[attr-defined]
-        return _eval(parsed)
+        parsed = ast.parse(expr.replace("^", "**"), mode="eval").body
+        return _compile_node(parsed)
+    except Exception:
+        return None
+
+
+def _safe_eval(expr: str, *, v: Any, mn: Any = None, mx: Any = None) -> float | None:
+    """Very small safe-eval for arithmetic expressions used in strings.
+
+    ``v`` (alias ``x``) is the raw input; ``min`` and ``max`` are the field bounds.
+    """
+    fn = _compile_expr(expr)
+    if fn is None:
+        return None
+    try:
+        return fn(v, mn, mx)
     except Exception:
         return None
 
 
 def _auto_fix_numeric(
     raw_val: Any,
-    info: FieldInfo,
+    ann: Any,
     *,
     low: float | int | None,
     high: float | int | None,
     policy: NumericPolicy,
     eval_allowed: bool,
 ) -> Any | None:
+    # already a number inside the bounds: nothing to coerce or enforce
+    if type(raw_val) in _NUMBER_TYPES and (low is None or raw_val >= low) and (high is None or raw_val <= high):
+        return raw_val
 
     # --- coercion / expression evaluation --------------------------------
     val = raw_val
@@ -191,22 +235,13 @@ def _auto_fix_numeric(
         expr = val
         if expr.startswith(("/", "*", "+", "-")):
             expr = f"v{expr}"
-        safe_names = dict(_SAFE_NAMES)
-        safe_names.update(
-            {
-                "v": raw_val,
-                "x": raw_val,
-                "min": low,
-                "max": high,
-            }
-        )
-        evaluated = _safe_eval(expr, safe_names)
+        evaluated = _safe_eval(expr, v=raw_val, mn=low, mx=high)
         if evaluated is not None:
             val = evaluated
 
     if not isinstance(val, (int, float)):
         try:
-            val = info.annotation(val)  # type: ignore[call-arg]
+            val = ann(val)  # type: ignore[call-arg]
         except Exception:
             if policy is NumericPolicy.BYPASS:
                 return raw_val
@@ -237,13 +272,34 @@ def _auto_fix_options(
     opts: list[Any],
     *,
     policy: OptionsPolicy,
+    members: frozenset[Any] | list[Any] | None = None,
+    choices: list[str] | None = None,
 ) -> Any | None:
-    if val in opts or policy is OptionsPolicy.BYPASS:
+    try:
+        known = val in (opts if members is None else members)
+    except TypeError:  # unhashable value against a frozenset of options
+        known = False
+    if known or policy is OptionsPolicy.BYPASS:
         return val
 
     if policy is OptionsPolicy.NEAREST and isinstance(val, str):
-        hit = get_close_matches(val, [str(o) for o in opts], n=1, cutoff=0.4)
-        return hit[0] if hit else None
+        if choices is None:
+            choices = [str(o) for o in opts]
+        candidates = choices
+        if _fuzz_process is not None:
+            # rapidfuzz's ratio (2 * LCS / total length) is never below
+            # difflib's, so this native pass only drops options difflib would
+            # reject as well; difflib still picks the winner, so the result
+            # does not depend on whether rapidfuzz is installed
+            candidates = [
+                c
+                for c, _score, _idx in _fuzz_process.extract(
+                    val, choices, scorer=_fuzz.ratio, score_cutoff=39.9, limit=None
+                )
+            ]
+        hit = get_close_matches(val, candidates, n=1, cutoff=0.4)
+        # return the option itself, not its string form
+        return opts[choices.index(hit[0])] if hit else None
 
     # reject
     return None
@@ -273,7 +329,7 @@ def _auto_fix_range(
             return None
 
     if isinstance(val, str):
-        parts = [p.strip() for p in val.split(sep)]
+        parts = list(map(str.strip, val.split(sep)))
         if len(parts) == 1 and allow_single:
             parts = [parts[0], parts[0]]
         val = parts
@@ -320,7 +376,7 @@ def _auto_fix_multiple_choice(
     sep = format_spec.get("input_separator")
     allow_duplicates = format_spec.get("allow_duplicates", False)
     if isinstance(val, str) and sep:
-        val = [v.strip() for v in val.split(sep) if v.strip()]
+        val = [v for v in map(str.strip, val.split(sep)) if v]
     elif not isinstance(val, list):
         val = [val]
 
@@ -351,6 +407,15 @@ def _auto_fix_multiple_choice(
     return val
 
 
+def _to_bool(x: Any) -> bool:
+    if isinstance(x, bool):
+        return x
+    return str(x).lower() in {"1", "true", "yes", "on"}
+
+
+_LIST_ITEM_TYPES = {"int": int, "float": float, "bool": _to_bool}  # anything else: str
+
+
 def _auto_fix_list_conversion(
     val: Any,
     format_spec: dict[str, Any],
@@ -365,46 +430,39 @@ def _auto_fix_list_conversion(
     item_type_name = format_spec.get("item_type", "int")
     strip_items = format_spec.get("strip_items", True)
 
+    convert = _LIST_ITEM_TYPES.get(item_type_name, str)
+
     def converter(x):
         try:
-            if item_type_name == "int":
-                return int(x)
-            if item_type_name == "float":
-                return float(x)
-            if item_type_name == "bool":
-                if isinstance(x, bool):
-                    return x
-                return str(x).lower() in {"1", "true", "yes", "on"}
-            return str(x)
+            return convert(x)
         except Exception:
             return None
 
     if input_is_string and isinstance(val, str):
         parts = val.split(sep)
         if strip_items:
-            parts = [p.strip() for p in parts]
+            parts = list(map(str.strip, parts))
         val = parts
     elif not isinstance(val, list):
         val = [val]
 
-    out = []
-    for item in val:
-        conv = converter(item)
-        if conv is None:
-            if policy == ListConversionPolicy.CONVERT_BEST_EFFORT:
-                continue
-            return None
-        out.append(conv)
+    # whole list in one C-level pass; any bad item falls back to the loop below
+    try:
+        out = list(map(convert, val))
+    except Exception:
+        out = None
+    if out is None:
+        out = []
+        for item in val:
+            conv = converter(item)
+            if conv is None:
+                if policy == ListConversionPolicy.CONVERT_BEST_EFFORT:
+                    continue
+                return None
+            out.append(conv)
 
     if not format_spec.get("allow_duplicates", True):
-        uniq = []
-        seen = set()
-        for item in out:
-            if item in seen:
-                continue
-            seen.add(item)
-            uniq.append(item)
-        out = uniq
+        out = list(dict.fromkeys(out))  # first occurrence wins, order kept
 
     min_items = format_spec.get("min_items")
     max_items = format_spec.get("max_items")
@@ -510,11 +568,7 @@ def _auto_fix_multiple_ranges(
         return val
 
     if isinstance(val, str) and format_spec.get("input_separator_list"):
-        items = [
-            v.strip()
-            for v in val.split(format_spec["input_separator_list"])
-            if v.strip()
-        ]
+        items = [v for v in map(str.strip, val.split(format_spec["input_separator_list"])) if v]
     elif not isinstance(val, list):
         items = [val]
     else:
@@ -562,18 +616,144 @@ def _auto_fix_multiple_ranges(
     return ranges
 
 
+def _enforce_length(val: Any, *, min_length: int | None, max_length: int | None) -> Any | None:
+    try:
+        size = len(val)
+    except TypeError:
+        return val
+    if (min_length is not None and size < min_length) or (max_length is not None and size > max_length):
+        return None
+    return val
+
+
+def _enforce_multiple_of(val: Any, *, multiple_of: float | int, policy: NumericPolicy) -> Any | None:
+    if type(val) is int and type(multiple_of) is int:
+        off = val % multiple_of  # exact, no float division
+    elif isinstance(val, (int, float)):
+        off = (val / multiple_of) % 1
+    else:
+        return val
+    if off:
+        if policy is NumericPolicy.CLAMP:
+            return round(val / multiple_of) * multiple_of
+        return None
+    return val
+
+
+_FORMAT_FIXERS = {
+    "range": lambda p: partial(_auto_fix_range, info=p.info, format_spec=p.fmt, policy=p.range_policy),
+    "multiple_choice": lambda p: partial(
+        _auto_fix_multiple_choice, opts=p.opts or [], format_spec=p.fmt, policy=p.multiple_choice_policy
+    ),
+    "list_conversion": lambda p: partial(
+        _auto_fix_list_conversion, format_spec=p.fmt, policy=p.list_conversion_policy
+    ),
+    "boolean_flexible": lambda p: partial(_auto_fix_boolean, format_spec=p.fmt, policy=p.boolean_policy),
+    "path_string": lambda p: partial(_auto_fix_path, format_spec=p.fmt, policy=p.path_policy),
+    "multiple_ranges": lambda p: partial(
+        _auto_fix_multiple_ranges,
+        info=p.info,
+        format_spec=p.fmt,
+        policy=p.multiple_ranges_policy,
+        item_policy=p.range_policy,
+    ),
+}
+
+
 # ------------------------------------------------------------------
-# utility helpers
+# per-field plans
 # ------------------------------------------------------------------
 
-def _field_meta_get(info: FieldInfo, key: str) -> Any | None:
-    """Return ``key`` from ``info.metadata`` if present and not ``None``."""
-    for m in info.metadata:
-        if hasattr(m, key):
-            val = getattr(m, key)
-            if val is not None:
-                return val
-    return None
+_POLICY_TYPES = {
+    "numeric_policy": NumericPolicy,
+    "options_policy": OptionsPolicy,
+    "range_policy": RangePolicy,
+    "multiple_choice_policy": MultipleChoicePolicy,
+    "list_conversion_policy": ListConversionPolicy,
+    "boolean_policy": BooleanPolicy,
+    "path_policy": PathPolicy,
+    "multiple_ranges_policy": MultipleRangesPolicy,
+}
+
+
+class _FieldPlan:
+    """Everything the auto-fix validator needs about one field.
+
+    Built once per model class from the field's metadata and
+    ``json_schema_extra``, so validation does no schema lookups. ``chain``
+    holds only the fixers this field's format and constraints call for, in
+    the order they apply.
+    """
+
+    __slots__ = (
+        "name", "info", "annotation", "fmt", "fmt_type", "opts", "opt_members", "choices",
+        "low", "high", "min_length", "max_length", "multiple_of", "numeric", "chain",
+        *_POLICY_TYPES,
+    )
+
+    def __init__(self, name: str, info: FieldInfo, defaults: dict[str, Enum], eval_allowed: bool):
+        extra = info.json_schema_extra if isinstance(info.json_schema_extra, dict) else {}
+        overrides = extra.get("autofix") or {}
+
+        self.name = name
+        self.info = info
+        self.annotation = info.annotation
+        self.fmt = extra.get("format_spec") or {}
+        self.fmt_type = self.fmt.get("type")
+        self.opts = extra.get("options")
+        self.choices = [str(o) for o in self.opts] if self.opts else None
+        try:
+            self.opt_members = frozenset(self.opts) if self.opts else None
+        except TypeError:  # unhashable options: keep list membership
+            self.opt_members = self.opts
+        for key, policy_cls in _POLICY_TYPES.items():
+            setattr(self, key, policy_cls(overrides.get(key, defaults[key])))
+
+        # the same single metadata scan that get_metadata() reports from
+        constraints = _extract_constraints(info)
+        ge_val = constraints.get("ge")
+        self.low = ge_val if ge_val is not None else constraints.get("gt")
+        le_val = constraints.get("le")
+        self.high = le_val if le_val is not None else constraints.get("lt")
+        self.min_length = constraints.get("min_length")
+        self.max_length = constraints.get("max_length")
+        self.multiple_of = constraints.get("multiple_of")
+        self.numeric = self.low is not None or self.high is not None or self.multiple_of is not None
+        self.chain = self._build_chain(eval_allowed)
+
+    def _build_chain(self, eval_allowed: bool) -> tuple[Callable[[Any], Any], ...]:
+        chain = []
+        make_format_fixer = _FORMAT_FIXERS.get(self.fmt_type)
+        if make_format_fixer is not None:
+            chain.append(make_format_fixer(self))
+        eff_num = self.numeric_policy
+        if self.numeric:
+            chain.append(
+                partial(
+                    _auto_fix_numeric,
+                    ann=self.annotation,
+                    low=self.low,
+                    high=self.high,
+                    policy=eff_num,
+                    eval_allowed=eval_allowed,
+                )
+            )
+        if self.opts and self.fmt_type != "multiple_choice":
+            chain.append(
+                partial(
+                    _auto_fix_options,
+                    opts=self.opts,
+                    policy=self.options_policy,
+                    members=self.opt_members,
+                    choices=self.choices,
+                )
+            )
+        # length limits only ever reject; multiple_of also clamps
+        if eff_num is NumericPolicy.REJECT and (self.min_length is not None or self.max_length is not None):
+            chain.append(partial(_enforce_length, min_length=self.min_length, max_length=self.max_length))
+        if self.multiple_of is not None and eff_num is not NumericPolicy.BYPASS:
+            chain.append(partial(_enforce_multiple_of, multiple_of=self.multiple_of, policy=eff_num))
+        return tuple(chain)
 
 
 # ------------------------------------------------------------------
@@ -619,95 +799,48 @@ def attach_auto_fix(
         path_pol = PathPolicy(path_policy)
         multi_range_pol = MultipleRangesPolicy(multiple_ranges_policy)
 
+        defaults = {
+            "numeric_policy": num_policy,
+            "options_policy": opt_policy,
+            "range_policy": range_pol,
+            "multiple_choice_policy": multi_pol,
+            "list_conversion_policy": list_pol,
+            "boolean_policy": bool_pol,
+            "path_policy": path_pol,
+            "multiple_ranges_policy": multi_range_pol,
+        }
+        # one plan per validated class: subclasses and models rebuilt by
+        # ConfigManager.update_model_field have their own model_fields
+        plans: weakref.WeakKeyDictionary[type, tuple[_FieldPlan, ...]] = weakref.WeakKeyDictionary()
+
+        def plan_for(model_cls: type[BaseModel]) -> tuple[_FieldPlan, ...]:
+            plan = plans.get(model_cls)
+            if plan is None:
+                plan = plans[model_cls] = tuple(
+                    _FieldPlan(name, info, defaults, eval_expressions) for name, info in model_cls.model_fields.items()
+                )
+            return plan
+
         @model_validator(mode=mode)
         def _auto(cls, raw: Any):  # noqa: D401
             if not isinstance(raw, dict):
                 return raw
 
-            fixed = dict(raw)
+            fixed = raw  # copied on the first correction; valid input passes through as is
 
-            for field_name, info in cls.model_fields.items():
-                if field_name not in fixed:
+            for p in plan_for(cls):
+                if not p.chain or p.name not in raw:
                     continue
-                val = fixed[field_name]
-
-                extra = info.json_schema_extra or {}
-                fmt = extra.get("format_spec") or {}
-                overrides = extra.get("autofix") or {}
-
-                eff_num = NumericPolicy(overrides.get("numeric_policy", num_policy))
-                eff_opt = OptionsPolicy(overrides.get("options_policy", opt_policy))
-                eff_range = RangePolicy(overrides.get("range_policy", range_pol))
-                eff_multi = MultipleChoicePolicy(
-                    overrides.get("multiple_choice_policy", multi_pol)
-                )
-                eff_list = ListConversionPolicy(
-                    overrides.get("list_conversion_policy", list_pol)
-                )
-                eff_bool = BooleanPolicy(overrides.get("boolean_policy", bool_pol))
-                eff_path = PathPolicy(overrides.get("path_policy", path_pol))
-                eff_multi_range = MultipleRangesPolicy(
-                    overrides.get("multiple_ranges_policy", multi_range_pol)
-                )
-
-                ge_val = _field_meta_get(info, "ge")
-                low = ge_val if ge_val is not None else _field_meta_get(info, "gt")
-                le_val = _field_meta_get(info, "le")
-                high = le_val if le_val is not None else _field_meta_get(info, "lt")
-                m_len = _field_meta_get(info, "min_length")
-                M_len = _field_meta_get(info, "max_length")
-                mult_of = _field_meta_get(info, "multiple_of")
-
-                fmt_type = fmt.get("type")
-                if fmt_type == "range":
-                    val = _auto_fix_range(val, info, fmt, policy=eff_range)
-                elif fmt_type == "multiple_choice":
-                    opts = extra.get("options") or []
-                    val = _auto_fix_multiple_choice(val, opts, fmt, policy=eff_multi)
-                elif fmt_type == "list_conversion":
-                    val = _auto_fix_list_conversion(val, fmt, policy=eff_list)
-                elif fmt_type == "boolean_flexible":
-                    val = _auto_fix_boolean(val, fmt, policy=eff_bool)
-                elif fmt_type == "path_string":
-                    val = _auto_fix_path(val, fmt, policy=eff_path)
-                elif fmt_type == "multiple_ranges":
-                    val = _auto_fix_multiple_ranges(
-                        val,
-                        info,
-                        fmt,
-                        policy=eff_multi_range,
-                        item_policy=eff_range,
-                    )
-
-                if low is not None or high is not None or mult_of is not None:
-                    val = _auto_fix_numeric(
-                        val,
-                        info,
-                        low=low,
-                        high=high,
-                        policy=eff_num,
-                        eval_allowed=eval_expressions,
-                    )
-
-                opts = extra.get("options")
-                if opts and fmt_type != "multiple_choice":
-                    val = _auto_fix_options(val, opts, policy=eff_opt)
-
-                if val is not None and m_len is not None and hasattr(val, "__len__"):
-                    if len(val) < m_len and eff_num is NumericPolicy.REJECT:
-                        val = None
-                if val is not None and M_len is not None and hasattr(val, "__len__"):
-                    if len(val) > M_len and eff_num is NumericPolicy.REJECT:
-                        val = None
-                if val is not None and mult_of is not None and isinstance(val, (int, float)):
-                    if (val / mult_of) % 1 != 0:
-                        if eff_num is NumericPolicy.CLAMP:
-                            val = round(val / mult_of) * mult_of
-                        elif eff_num is NumericPolicy.REJECT:
-                            val = None
-
-                if val is not None:
-                    fixed[field_name] = val
+                orig = val = raw[p.name]
+                for fix in p.chain:
+                    val = fix(val)
+                    if val is None:  # rejected: leave the raw value to pydantic
+                        break
+                else:
+                    if val is not orig:
+                        if fixed is raw:
+                            fixed = dict(raw)
+                        fixed[p.name] = val
 
             return fixed
 
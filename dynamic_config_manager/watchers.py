@@ -10,7 +10,7 @@ from typing import Iterable, Tuple, Dict, Set, Any
 
 from watchfiles import watch, Change
 
-from .manager import ConfigManager
+from .manager import ConfigManager, _detached
 
 # Set up logging
 log = logging.getLogger(__name__)
@@ -30,7 +30,7 @@ def _normalize_path(path: Path) -> str:
         # Then normalize case for Windows compatibility
         return os.path.normcase(str(resolved_path))
     except (OSError, ValueError) as e:
-        log.warning(f"Failed to normalize path {path}: {e}")
+        log.warning("Failed to normalize path %s: %s", path, e)
         # Fallback to basic normalization
         return os.path.normcase(str(path))
 
@@ -98,17 +98,17 @@ def watch_and_reload(
                     # Add the parent directory to our watch list
                     watch_directories.add(file_path.parent)
 
-                    log.debug(f"Watching config '{config_name}' at {file_path}")
+                    log.debug("Watching config '%s' at %s", config_name, file_path)
 
                 except (OSError, ValueError) as e:
-                    log.warning(f"Could not resolve path for config '{config_name}': {e}")
+                    log.warning("Could not resolve path for config '%s': %s", config_name, e)
                     continue
 
             if not watch_directories:
                 log.debug("No directories to watch, exiting watcher loop")
                 return
 
-            log.debug(f"Watching {len(watch_directories)} directories for {len(file_map)} config files")
+            log.debug("Watching %s directories for %s config files", len(watch_directories), len(file_map))
 
             # Determine which file change events should trigger reloads
             reload_events = {Change.modified, Change.added}
@@ -121,16 +121,16 @@ def watch_and_reload(
                 moved_event = getattr(Change, "move", None)
             if moved_event is not None:
                 reload_events.add(moved_event)
-                log.debug(f"Including moved/atomic save events: {moved_event}")
+                log.debug("Including moved/atomic save events: %s", moved_event)
 
-            log.debug(f"Watching for events: {reload_events}")
+            log.debug("Watching for events: %s", reload_events)
 
             # Main file watching loop
             for change_batch in watch(*watch_directories, debounce=debounce, stop_event=stop_event):
                 if stop_event.is_set():
                     break
 
-                log.debug(f"File changes detected: {change_batch}")
+                log.debug("File changes detected: %s", change_batch)
 
                 # Collect affected config instances (avoid duplicates)
                 affected_configs: Set[Any] = set()
@@ -138,7 +138,7 @@ def watch_and_reload(
                 for change_type, changed_path_str in change_batch:
                     # Skip change types we don't care about
                     if change_type not in reload_events:
-                        log.debug(f"Ignoring change type {change_type} for {changed_path_str}")
+                        log.debug("Ignoring change type %s for %s", change_type, changed_path_str)
                         continue
 
                     try:
@@ -148,7 +148,7 @@ def watch_and_reload(
                         # Look for exact file match
                         config_instance = file_map.get(normalized_changed_path)
                         if config_instance is not None:
-                            log.debug(f"Found exact match for {changed_path_str}")
+                            log.debug("Found exact match for %s", changed_path_str)
                             affected_configs.add(config_instance)
                             continue
 
@@ -162,12 +162,12 @@ def watch_and_reload(
                             file_path_obj = Path(file_path)
                             if _normalize_path(file_path_obj.parent) == normalized_parent:
                                 if file_path_obj.name == changed_path.name:
-                                    log.debug(f"Found parent directory match for {changed_path_str}")
+                                    log.debug("Found parent directory match for %s", changed_path_str)
                                     affected_configs.add(instance)
                                     break
 
                     except (OSError, ValueError) as e:
-                        log.warning(f"Error processing changed path {changed_path_str}: {e}")
+                        log.warning("Error processing changed path %s: %s", changed_path_str, e)
                         continue
 
                 # Reload each affected config instance
@@ -175,14 +175,14 @@ def watch_and_reload(
                     _reload_config_instance(config_instance)
 
         except Exception as e:
-            log.error(f"File watcher loop failed: {e}", exc_info=True)
+            log.error("File watcher loop failed: %s", e, exc_info=True)
         finally:
             log.debug("File watcher loop exiting")
 
     def _reload_config_instance(config_instance: Any) -> None:
         """Reload a single config instance from disk with retry logic."""
         config_name = getattr(config_instance, 'name', '<unknown>')
-        log.debug(f"Reloading config '{config_name}'")
+        log.debug("Reloading config '%s'", config_name)
 
         # Retry loading with exponential backoff to handle cases where
         # the file is temporarily locked by the writing process
@@ -196,14 +196,14 @@ def watch_and_reload(
                 if loaded_instance is not None:
                     # Successfully loaded new configuration
                     config_instance._active = loaded_instance
-                    log.debug(f"Successfully reloaded config '{config_name}' on attempt {attempt + 1}")
+                    log.debug("Successfully reloaded config '%s' on attempt %s", config_name, attempt + 1)
                     return
                 else:
                     # _load_from_disk returned None, which means parsing failed
-                    log.debug(f"Failed to parse config '{config_name}' on attempt {attempt + 1}")
+                    log.debug("Failed to parse config '%s' on attempt %s", config_name, attempt + 1)
 
             except Exception as e:
-                log.warning(f"Error loading config '{config_name}' on attempt {attempt + 1}: {e}")
+                log.warning("Error loading config '%s' on attempt %s: %s", config_name, attempt + 1, e)
 
             # Wait before retrying, with exponential backoff
             if attempt < max_attempts - 1:
@@ -213,18 +213,22 @@ def watch_and_reload(
         # All attempts failed, check if file still exists
         try:
             if config_instance._save_path and not config_instance._save_path.exists():
-                log.info(f"Config file for '{config_name}' no longer exists, resetting to defaults")
-                config_instance._active = config_instance._defaults.model_copy(deep=True)
+                log.info("Config file for '%s' no longer exists, resetting to defaults", config_name)
+                config_instance._active = _detached(config_instance._defaults)
             else:
-                log.warning(f"Failed to reload config '{config_name}' after {max_attempts} attempts, keeping current state")
+                log.warning(
+                    "Failed to reload config '%s' after %s attempts, keeping current state",
+                    config_name,
+                    max_attempts,
+                )
         except Exception as e:
-            log.error(f"Error checking if config file exists for '{config_name}': {e}")
+            log.error("Error checking if config file exists for '%s': %s", config_name, e)
 
     # Create and start the watcher thread
     thread = threading.Thread(target=_watcher_loop, daemon=True, name="ConfigWatcher")
     thread.start()
 
-    log.debug(f"Started file watcher thread: {thread.name}")
+    log.debug("Started file watcher thread: %s", thread.name)
     return thread, stop_event
 
 
@@ -123,3 +123,64 @@ def test_get_helpers_and_defaults(tmp_path):
     assert inst.get_default("missing", 2) == 2
     assert inst.get_saved("missing", 3) == 3
     assert inst.get_metadata("missing", 4) == 4
+
+
+def test_debounced_auto_save(tmp_path):
+    ConfigManager.default_dir = tmp_path
+    inst = ConfigManager.register("simple", SimpleCfg, auto_save=True, auto_save_delay=60)
+    path = tmp_path / "simple.json"
+
+    inst.active.foo = 5
+    inst.active.bar = "hello"
+    assert not path.exists()
+
+    ConfigManager.flush()
+    data = json.loads(path.read_text())
+    assert data["foo"] == 5
+    assert data["bar"] == "hello"
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_saved_reads_reuse_parsed_file(tmp_path):
+    ConfigManager.default_dir = tmp_path
+    inst = ConfigManager.register("simple", SimpleCfg)
+    inst.set_value("foo", 5)
+    inst.persist()
+
+    assert inst.get_saved("foo") == 5
+    first = inst._disk_cache[2]
+    assert inst.saved.foo == 5
+    assert inst._disk_cache[2] is first
+
+    inst.set_value("foo", 6)
+    inst.persist()
+    assert inst.get_saved("foo") == 6
+
+
+def test_restore_defaults_shares_immutable_defaults(tmp_path):
+    ConfigManager.default_dir = tmp_path
+    inst = ConfigManager.register("simple", SimpleCfg, persistent=False)
+    inst.set_value("foo", 5)
+    inst.restore_defaults()
+    assert inst._active is inst._defaults
+
+    inst.set_value("foo", 6)
+    assert inst.get_default("foo") == 1
+
+
+def test_pending_auto_save_flushed_at_exit(tmp_path):
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    script = (
+        "from dynamic_config_manager import ConfigManager, DynamicBaseSettings, ConfigField\n"
+        "class Cfg(DynamicBaseSettings):\n"
+        "    foo: int = ConfigField(1)\n"
+        f"ConfigManager.default_dir = {str(tmp_path)!r}\n"
+        "inst = ConfigManager.register('late', Cfg, auto_save=True, auto_save_delay=60)\n"
+        "inst.set_value('foo', 4)\n"
+    )
+    root = Path(__file__).resolve().parents[1]
+    subprocess.run([sys.executable, "-c", script], check=True, cwd=root)
+    assert json.loads((tmp_path / "late.json").read_text())["foo"] == 4
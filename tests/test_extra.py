@@ -1,11 +1,16 @@
 import json
+import math
+import operator
 import os
 import time
+import warnings
 from pathlib import Path
 
 import pytest
 import tomli
 import yaml
+from pydantic import ValidationError
+from pydantic.fields import PydanticUndefined
 
 from dynamic_config_manager import (
     ConfigManager,
@@ -14,7 +19,20 @@ from dynamic_config_manager import (
     attach_auto_fix,
     watch_and_reload,
 )
-from dynamic_config_manager.manager import _deep_get, _deep_set
+from dynamic_config_manager import manager as manager_mod
+from dynamic_config_manager.cli import main as cli_main
+from dynamic_config_manager.manager import (
+    _MMAP_THRESHOLD,
+    _UNSET,
+    _constructible,
+    _deep_get,
+    _deep_set,
+    _field_table,
+    _json_dumps,
+    _load_file,
+    _mutable_fields,
+    _path_getter,
+)
 
 
 class ListCfg(DynamicBaseSettings):
@@ -25,11 +43,34 @@ class ProtectCfg(DynamicBaseSettings):
     secret: int = ConfigField(1, json_schema_extra={"editable": False})
 
 
+class InnerCfg(DynamicBaseSettings):
+    level: int = ConfigField(1, ge=0, le=5)
+    tags: list[str] = ConfigField(["a"])
+
+
+class OuterCfg(DynamicBaseSettings):
+    inner: InnerCfg = ConfigField(default_factory=InnerCfg)
+    name: str = ConfigField("x")
+
+
+class AliasedInnerCfg(DynamicBaseSettings):
+    level: int = ConfigField(1, ge=0, le=5, alias="lvl", repr=False)
+
+
+class AliasedOuterCfg(DynamicBaseSettings):
+    inner: AliasedInnerCfg = ConfigField(default_factory=AliasedInnerCfg)
+
+
 @attach_auto_fix(eval_expressions=True)
 class AutoFixCfg(DynamicBaseSettings):
     val: int = ConfigField(0, ge=0, le=10)
 
 
+class AutoFixHolderCfg(DynamicBaseSettings):
+    fixed: AutoFixCfg = ConfigField(default_factory=AutoFixCfg)
+    other: InnerCfg = ConfigField(default_factory=InnerCfg)
+
+
 def setup_function(_):
     ConfigManager._instances.clear()
 
@@ -38,6 +79,14 @@ def test_deep_helpers_on_list():
     model = ListCfg()
     updated = _deep_set(model, ["items", "1"], 5)
     assert _deep_get(updated, ["items", "1"]) == 5
+    assert model.items == [1, 2]
+
+
+def test_deep_set_shares_untouched_branches():
+    model = OuterCfg()
+    updated = _deep_set(model, ["inner", "level"], 3)
+    assert updated.inner.level == 3 and model.inner.level == 1
+    assert updated.inner.tags is model.inner.tags
 
 
 def test_list_index_and_save_as(tmp_path: Path):
@@ -56,6 +105,219 @@ def test_list_index_and_save_as(tmp_path: Path):
     assert tomli.loads(toml_path.read_text())["items"] == [1, 2, 9]
 
 
+def test_save_as_json_matches_persist(tmp_path: Path):
+    ConfigManager.default_dir = tmp_path
+    inst = ConfigManager.register("outer", OuterCfg)
+    inst.set_value("inner.level", 3)
+    assert inst.persist()
+    assert inst.save_as(tmp_path / "export.json")
+    assert (tmp_path / "export.json").read_bytes() == (tmp_path / "outer.json").read_bytes()
+
+
+def test_json_dumps_matches_persisted_layout(tmp_path: Path):
+    data = {"ok": 1.5, "nan": math.nan, "inf": -math.inf, "path": Path("a")}
+    expected = b'{\n    "ok": 1.5,\n    "nan": null,\n    "inf": null,\n    "path": "a"\n}'
+    assert _json_dumps(data) == expected
+
+    ConfigManager.default_dir = tmp_path
+    inst = ConfigManager.register("lst", ListCfg)
+    inst.persist()
+    assert (tmp_path / "lst.json").read_bytes() == _json_dumps(inst.active.model_dump())
+
+
+def test_msgpack_round_trip(tmp_path: Path):
+    pytest.importorskip("msgspec")
+    inst = ConfigManager.register("packed", ListCfg, save_path=tmp_path / "packed.msgpack")
+    inst.set_value("items", [7, 8])
+    assert inst.persist()
+
+    ConfigManager._instances.clear()
+    again = ConfigManager.register("packed", ListCfg, save_path=tmp_path / "packed.msgpack")
+    assert again.active.items == [7, 8]
+
+
+def test_load_large_files(tmp_path: Path):
+    data = {"items": list(range(_MMAP_THRESHOLD // 4))}
+    json_path = tmp_path / "big.json"
+    json_path.write_text(json.dumps(data))
+    yaml_path = tmp_path / "big.yaml"
+    yaml_path.write_text(yaml.safe_dump(data))
+    assert json_path.stat().st_size > _MMAP_THRESHOLD
+    assert _load_file(json_path) == data
+    assert _load_file(yaml_path) == data
+
+
+def test_nested_set_value_validates_leaf(tmp_path: Path):
+    ConfigManager.default_dir = tmp_path
+    inst = ConfigManager.register("outer", OuterCfg, persistent=False)
+    before = inst._active
+
+    inst.set_value("inner.level", "3")
+    assert inst.get_value("inner.level") == 3
+    assert before.inner.level == 1
+    assert inst._active.inner.tags is before.inner.tags
+
+    inst.set_value("inner.level", 42)
+    assert inst.get_value("inner.level") == 5
+    with pytest.raises(ValueError):
+        inst.set_value("inner.level", "abc")
+    with pytest.raises(KeyError):
+        inst.set_value("inner.missing", 1)
+
+    inst.set_value("inner.tags.1", "b")
+    assert inst.get_value("inner.tags") == ["a", "b"]
+
+    # model-only Field attributes must not leak into the leaf validator
+    inst = ConfigManager.register("aliased", AliasedOuterCfg, persistent=False)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        inst.set_value("inner.level", "4")
+        inst.set_value("inner.level", 9)
+    assert caught == []
+    assert inst.get_value("inner.level") == 5
+
+
+def test_set_value_skips_equal_values(tmp_path: Path):
+    ConfigManager.default_dir = tmp_path
+    inst = ConfigManager.register("outer", OuterCfg, auto_save=True)
+    path = tmp_path / "outer.json"
+    before = inst._active
+
+    inst.set_value("inner.level", 1)
+    inst.set_value("inner.tags", ["a"])
+    assert inst._active is before
+    assert not path.exists()
+
+    tags = inst.get_value("inner.tags")
+    tags.append("b")
+    inst.set_value("inner.tags", tags)
+    assert json.loads(path.read_text())["inner"]["tags"] == ["a", "b"]
+
+
+def test_set_values_applies_all_or_nothing(tmp_path: Path):
+    ConfigManager.default_dir = tmp_path
+    inst = ConfigManager.register("outer", OuterCfg, auto_save=True)
+    inst.set_values({"inner.level": 9, "inner.tags.1": "b", "name": "y"})
+    assert inst.get_value("inner.level") == 5
+    assert inst.get_value("inner.tags") == ["a", "b"]
+    assert json.loads((tmp_path / "outer.json").read_text())["name"] == "y"
+
+    with pytest.raises(ValueError):
+        inst.set_values({"name": "z", "inner.level": "abc"})
+    assert inst.get_value("name") == "y"
+    with pytest.raises(KeyError):
+        inst.set_values({"name": "z", "inner.missing": 1})
+
+
+def test_nested_saved_accessor(tmp_path: Path):
+    ConfigManager.default_dir = tmp_path
+    inst = ConfigManager.register("outer", OuterCfg)
+    assert inst.saved.inner is PydanticUndefined
+    inst.set_value("inner.level", 4)
+    inst.persist()
+    inst.set_value("inner.level", 2)
+
+    saved = inst.saved
+    assert saved.inner.level == 4
+    assert saved.inner.tags == ["a"]
+    assert saved.inner.nope is PydanticUndefined
+
+
+def test_nested_validators_revalidate_only_their_subtree(tmp_path: Path):
+    ConfigManager.default_dir = tmp_path
+    inst = ConfigManager.register("holder", AutoFixHolderCfg, persistent=False)
+    before = inst._active
+
+    inst.set_value("fixed.val", "2*3")
+    assert inst.get_value("fixed.val") == 6
+    assert inst._active.other is before.other
+
+
+def test_register_defers_model_construction(tmp_path: Path):
+    ConfigManager.default_dir = tmp_path
+    inst = ConfigManager.register("lazy", ListCfg)
+    assert inst._active_model is _UNSET
+    assert inst._defaults_model is _UNSET
+
+    assert inst.get_value("items") == [1, 2]
+    assert inst._active_model is not _UNSET
+    inst.set_value("items", [3])
+    inst.persist()
+
+    ConfigManager._instances.clear()
+    again = ConfigManager.register("lazy", ListCfg)
+    assert again.get_value("items") == [3]
+    assert again._defaults_model is _UNSET
+    assert again.get_default("items") == [1, 2]
+
+
+class RequiredCfg(DynamicBaseSettings):
+    b: int
+
+
+def test_lazy_load_errors_surface_on_first_access(tmp_path: Path):
+    ConfigManager.default_dir = tmp_path
+    inst = ConfigManager.register("req", RequiredCfg, persistent=False)
+    with pytest.raises(ValidationError):
+        inst.get_value("b")
+    with pytest.raises(ValidationError):
+        inst.get_metadata("b")
+    with pytest.raises(ValidationError):
+        inst.active.b
+    with pytest.raises(ValidationError):
+        inst.get_default("b")
+
+    bad = tmp_path / "bad.yaml"
+    bad.write_text("items: [1, 2\n")
+    inst = ConfigManager.register("bad", ListCfg, save_path=bad)
+    with pytest.raises(yaml.YAMLError):
+        inst.get_value("items")
+    with pytest.raises(yaml.YAMLError):
+        inst.get_metadata("items")
+
+
+def test_config_instance_has_no_instance_dict(tmp_path: Path):
+    ConfigManager.default_dir = tmp_path
+    inst = ConfigManager.register("slotted", ListCfg)
+    assert not hasattr(inst, "__dict__")
+    with pytest.raises(AttributeError):
+        inst.unexpected = 1
+    with pytest.raises(AttributeError):
+        ConfigManager.unexpected = 1
+
+
+def test_trusted_reload_skips_validation_for_own_files(tmp_path: Path):
+    ConfigManager.default_dir = tmp_path
+    inst = ConfigManager.register("outer", OuterCfg, trusted_reload=True)
+    inst.set_value("inner.level", 4)
+    inst.persist()
+    assert (tmp_path / "outer.json.sha256").exists()
+
+    ConfigManager._instances.clear()
+    again = ConfigManager.register("outer", OuterCfg, trusted_reload=True)
+    trusted = again._load_trusted()
+    assert isinstance(trusted.inner, InnerCfg) and trusted.inner.level == 4
+    assert again.get_value("inner.level") == 4
+
+    # hand edits break the checksum, so the file is validated again
+    path = tmp_path / "outer.json"
+    data = json.loads(path.read_text())
+    data["inner"]["level"] = "abc"
+    path.write_text(json.dumps(data))
+    ConfigManager._instances.clear()
+    edited = ConfigManager.register("outer", OuterCfg, trusted_reload=True)
+    assert edited._load_trusted() is None
+    assert edited.get_value("inner.level") == 1
+
+
+def test_constructible_models():
+    class PathCfg(DynamicBaseSettings):
+        where: Path = ConfigField(Path("."))
+
+    assert _constructible(OuterCfg)
+    assert not _constructible(PathCfg)
+
+
 def test_permission_error(tmp_path: Path):
     ConfigManager.default_dir = tmp_path
     inst = ConfigManager.register("prot", ProtectCfg)
@@ -87,6 +349,92 @@ def test_save_restore_all(tmp_path: Path):
     assert a.active.items[0] == 1
 
 
+def test_save_all_skips_clean_instances(tmp_path: Path):
+    ConfigManager.default_dir = tmp_path
+    a = ConfigManager.register("a", ListCfg)
+    b = ConfigManager.register("b", ListCfg)
+    ConfigManager.save_all()
+
+    a.set_value("items", [5])
+    b_file = tmp_path / "b.json"
+    b_file.write_text('{"items": [9]}')
+    b_mtime = b_file.stat().st_mtime_ns
+    assert ConfigManager.save_all() == {"a": True}
+    assert json.loads((tmp_path / "a.json").read_text())["items"] == [5]
+    # b is clean: its in-memory values were not written over the edited file
+    assert b.get_value("items") == [1, 2]
+    assert b_file.stat().st_mtime_ns == b_mtime
+    assert json.loads(b_file.read_text())["items"] == [9]
+
+    ConfigManager.save_all(force=True)
+    assert json.loads(b_file.read_text())["items"] == [1, 2]
+
+
+def test_persist_skips_unchanged_payload(tmp_path: Path, monkeypatch):
+    ConfigManager.default_dir = tmp_path
+    inst = ConfigManager.register("list", ListCfg)
+    inst.set_value("items", [3])
+    assert inst.persist()
+
+    writes = []
+    real_write = manager_mod._atomic_write
+    monkeypatch.setattr(manager_mod, "_atomic_write", lambda *a: writes.append(a) or real_write(*a))
+    inst.set_value("items", [4])
+    inst.set_value("items", [3])
+    assert inst.persist()
+    assert writes == []
+
+    # an external edit invalidates the remembered state
+    (tmp_path / "list.json").write_text('{"items": [9]}')
+    assert inst.persist()
+    assert len(writes) == 1
+    assert json.loads((tmp_path / "list.json").read_text())["items"] == [3]
+
+
+def test_bulk_defers_auto_save(tmp_path: Path):
+    ConfigManager.default_dir = tmp_path
+    a = ConfigManager.register("a", ListCfg, auto_save=True)
+    b = ConfigManager.register("b", ListCfg, auto_save=True)
+
+    with ConfigManager.bulk():
+        a.set_value("items", [3])
+        ConfigManager.restore_all_defaults()
+        a.set_value("items", [4])
+        assert not (tmp_path / "a.json").exists()
+
+    assert a._auto_save and b._auto_save
+    assert json.loads((tmp_path / "a.json").read_text())["items"] == [4]
+    assert (tmp_path / "b.json").exists()
+
+
+def test_batch_update_saves_once(tmp_path: Path):
+    ConfigManager.default_dir = tmp_path
+    inst = ConfigManager.register("outer", OuterCfg, auto_save=True)
+    path = tmp_path / "outer.json"
+    with inst.batch_update():
+        inst.set_value("inner.level", 2)
+        inst.set_value("name", "y")
+        assert not path.exists()
+
+    assert inst._auto_save
+    assert json.loads(path.read_text()) == {"inner": {"level": 2, "tags": ["a"]}, "name": "y"}
+
+
+def test_full_rebuild_reuses_active_dump(tmp_path: Path):
+    ConfigManager.default_dir = tmp_path
+    inst = ConfigManager.register("auto", AutoFixCfg, persistent=False)
+    with pytest.raises(ValueError):
+        inst.set_value("val", "abc")
+    dump = inst._dump_cache[1]
+    with pytest.raises(ValueError):
+        inst.set_value("val", "xyz")
+    assert inst._dump_cache[1] is dump
+    assert dump == {"val": 0}
+
+    inst.set_value("val", "2+3")
+    assert inst.get_value("val") == 5
+
+
 def test_watch_and_reload_autofix(tmp_path: Path):
     ConfigManager.default_dir = tmp_path
     inst = ConfigManager.register("auto", AutoFixCfg, auto_save=True)
@@ -110,3 +458,60 @@ def test_watch_and_reload_autofix(tmp_path: Path):
     thread.join(timeout=1)
 
     assert inst.active.val == 10
+
+
+def test_restore_defaults_copies_only_mutable_fields(tmp_path: Path):
+    ConfigManager.default_dir = tmp_path
+    inst = ConfigManager.register("outer", OuterCfg, persistent=False)
+    assert _mutable_fields(OuterCfg) == ("inner",)
+    assert _mutable_fields(InnerCfg) == ("tags",)
+
+    inst.restore_defaults()
+    inst.active.inner.tags.append("b")
+    assert inst.default.inner.tags == ["a"]
+
+
+def test_restore_value_does_not_alias_sources(tmp_path: Path):
+    ConfigManager.default_dir = tmp_path
+    inst = ConfigManager.register("outer", OuterCfg)
+    inst.persist()
+
+    inst.restore_value("inner")
+    restored = inst.get_value("inner")
+    assert restored is not inst._defaults.inner
+    restored.level = 4
+    restored.tags.append("b")
+    assert inst.get_default("inner.level") == 1
+    assert inst.get_default("inner.tags") == ["a"]
+
+    inst.restore_value("inner", source="file")
+    inst.get_value("inner").tags.append("c")
+    inst.restore_value("inner.tags", source="file")
+    inst.get_value("inner.tags").append("d")
+    assert inst.get_saved("inner.tags") == ["a"]
+
+
+def test_field_table_covers_nested_paths():
+    table = _field_table(OuterCfg)
+    assert set(table) == {("inner",), ("inner", "level"), ("inner", "tags"), ("name",)}
+    _field, head, _tail = table[("inner", "level")]
+    assert head["ge"] == 0 and head["le"] == 5
+
+
+def test_path_getter_specialises_model_paths():
+    model = OuterCfg()
+    assert isinstance(_path_getter(OuterCfg, "inner.level"), operator.attrgetter)
+    assert _path_getter(OuterCfg, "inner.level")(model) == 1
+    assert _path_getter(OuterCfg, "inner.tags.0")(model) == "a"
+    with pytest.raises(AttributeError):
+        _path_getter(OuterCfg, "inner.nope")(model)
+
+
+def test_cli_set_many(tmp_path: Path):
+    path = tmp_path / "cfg.json"
+    path.write_text(json.dumps({"ui": {"theme": "light"}, "port": 1}))
+    cli_main(["set-many", str(path), "ui.theme=\"dark\"", "port=8080", "db.hosts=[\"a\"]", "--json-value"])
+    assert json.loads(path.read_text()) == {"ui": {"theme": "dark"}, "port": 8080, "db": {"hosts": ["a"]}}
+
+    with pytest.raises(SystemExit):
+        cli_main(["set-many", str(path), "no-separator"])
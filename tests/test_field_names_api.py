@@ -163,3 +163,12 @@ class TestFieldNamesAPI:
             assert metadata is not None
             assert "type" in metadata
             assert "default" in metadata
+
+    def test_field_names_returns_independent_lists(self):
+        """Test that cached field names cannot be mutated through the result."""
+        cfg = ConfigManager.register("test_independent_lists", NestedConfig, persistent=False)
+        first = cfg.get_field_names()
+        first.append("bogus")
+
+        assert "bogus" not in cfg.get_field_names()
+        assert cfg.get_field_names("db") == ["host", "port"]
@@ -269,6 +269,22 @@ class TestMetadata:
         from pydantic.fields import PydanticUndefined
         assert meta["saved_value"] is PydanticUndefined
 
+    def test_metadata_without_saved_value(self, tmp_path):
+        """Test that include_saved=False skips the persisted value."""
+
+        class SavedConfig(DynamicBaseSettings):
+            level: int = ConfigField(default=1)
+
+        cfg = ConfigManager.register("test_no_saved", SavedConfig, save_path=tmp_path / "s.json")
+        cfg.set_value("level", 3)
+        cfg.persist()
+
+        from pydantic.fields import PydanticUndefined
+        assert cfg.get_metadata("level")["saved_value"] == 3
+        meta = cfg.get_metadata("level", include_saved=False)
+        assert meta["active_value"] == 3
+        assert meta["saved_value"] is PydanticUndefined
+
     def teardown_method(self):
         """Clean up registered configs after each test."""
         # Clear all registered instances to avoid conflicts
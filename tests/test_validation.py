@@ -319,6 +319,8 @@ def test_numeric_multiple_of(tmp_path):
     inst = ConfigManager.register("step", StepCfg)
     inst.active.step = 12
     assert inst.active.step == 10
+    inst.active.step = 10**17 + 1  # beyond float precision
+    assert inst.active.step == 10**17
     inst = ConfigManager.register("steprej", StepRejectCfg)
     with pytest.raises(ValueError):
         inst.active.step = 12
@@ -380,6 +382,8 @@ def test_list_conversion_policies(tmp_path):
     inst = ConfigManager.register("lcbest", LCBestEffortCfg)
     inst.active.items = "1, x, 2, 2"
     assert inst.active.items == [1, 2]
+    inst.active.items = "3, 1, 3"
+    assert inst.active.items == [3, 1]
     inst = ConfigManager.register("lcbyp", LCBypassCfg)
     with pytest.raises(ValueError):
         inst.active.items = "1, x"
@@ -412,3 +416,111 @@ def test_multiple_ranges_policies(tmp_path):
     assert inst.active.ranges == [(1, 2), (3, 4), (5, 6)]
     with pytest.raises(ValueError):
         inst.active.ranges = "1-3;2-4"
+
+
+class WideNumCfg(NumCfg):
+    val: int = ConfigField(1, ge=0, le=20)
+
+
+def test_autofix_plan_is_per_class(tmp_path):
+    ConfigManager.default_dir = tmp_path
+    narrow = ConfigManager.register("narrow", NumCfg)
+    wide = ConfigManager.register("wide", WideNumCfg)
+    narrow.active.val = "30"
+    wide.active.val = "30"
+    assert narrow.active.val == 10
+    assert wide.active.val == 20
+
+
+def test_safe_eval_compiles_each_expression_once():
+    from dynamic_config_manager.validation import _compile_expr, _safe_eval
+
+    _compile_expr.cache_clear()
+    assert _safe_eval("max/2 + v", v=1, mx=8) == 5
+    assert _safe_eval("max/2 + v", v=3, mx=8) == 7
+    assert _compile_expr.cache_info().misses == 1
+    assert _safe_eval("sqrt(16)^2 + min + round(pi)", v=0, mn=1) == 20
+    assert _safe_eval("__import__('os')", v=0) is None
+    assert _safe_eval("v.real", v=1) is None
+
+
+def test_options_nearest_returns_original_option():
+    from dynamic_config_manager.validation import OptionsPolicy, _auto_fix_options
+
+    opts = [1024, 2048, 4096]
+    hit = _auto_fix_options("2049", opts, policy=OptionsPolicy.NEAREST, members=frozenset(opts))
+    assert hit == 2048 and type(hit) is int
+
+
+def test_field_plan_chain_only_has_needed_fixers():
+    from dynamic_config_manager.validation import _POLICY_TYPES, _FieldPlan
+
+    defaults = {key: next(iter(policy_cls)) for key, policy_cls in _POLICY_TYPES.items()}
+
+    class Plain(DynamicBaseSettings):
+        name: str = ConfigField("x")
+        level: int = ConfigField(1, ge=0, le=5)
+
+    plain = _FieldPlan("name", Plain.model_fields["name"], defaults, True)
+    level = _FieldPlan("level", Plain.model_fields["level"], defaults, True)
+    assert plain.chain == ()
+    assert [fix.func.__name__ for fix in level.chain] == ["_auto_fix_numeric"]
+
+
+def test_autofix_copies_input_only_when_fixing():
+    validators = NumCfg.__pydantic_decorators__.model_validators
+    auto = next(d.func for name, d in validators.items() if name.startswith("__auto_fix_"))
+
+    raw = {"val": 3}
+    assert auto(raw) is raw
+    raw = {"val": "30"}
+    assert auto(raw) == {"val": 10}
+    assert raw == {"val": "30"}
+
+
+class _IndelFuzz:
+    """Stand-in for ``rapidfuzz.fuzz``: normalised Indel similarity, 0-100."""
+
+    @staticmethod
+    def ratio(a, b):
+        prev = [0] * (len(b) + 1)
+        for ca in a:
+            cur = [0]
+            for j, cb in enumerate(b):
+                cur.append(prev[j] + 1 if ca == cb else max(prev[j + 1], cur[j]))
+            prev = cur
+        total = len(a) + len(b)
+        return 100.0 * 2 * prev[-1] / total if total else 100.0
+
+
+class _FuzzProcess:
+    """Stand-in for ``rapidfuzz.process`` (only ``extract``)."""
+
+    @staticmethod
+    def extract(query, choices, *, scorer, score_cutoff, limit):
+        hits = [(c, scorer(query, c), i) for i, c in enumerate(choices)]
+        hits = [h for h in hits if h[1] >= score_cutoff]
+        return sorted(hits, key=lambda h: -h[1])[:limit]
+
+
+@pytest.mark.parametrize(
+    "val, opts, expected",
+    [
+        ("falt", ["flat", "ball", "vbit"], "flat"),
+        ("accabc", ["bccbacb"], None),  # Indel 61.5, difflib 0.31
+        ("bbba", ["cabcac"], None),  # Indel exactly 40, difflib 0.2
+        ("ab", ["ac", "ad"], "ad"),  # difflib tie: same pick on both backends
+    ],
+)
+def test_options_nearest_same_pick_with_and_without_rapidfuzz(monkeypatch, val, opts, expected):
+    from dynamic_config_manager import validation
+    from dynamic_config_manager.validation import OptionsPolicy, _auto_fix_options
+
+    assert _IndelFuzz.ratio("accabc", "bccbacb") == pytest.approx(61.54, abs=0.01)
+    monkeypatch.setattr(validation, "_fuzz", None)
+    monkeypatch.setattr(validation, "_fuzz_process", None)
+    assert _auto_fix_options(val, opts, policy=OptionsPolicy.NEAREST) == expected
+
+    monkeypatch.setattr(validation, "_fuzz", _IndelFuzz)
+    monkeypatch.setattr(validation, "_fuzz_process", _FuzzProcess)
+    assert _auto_fix_options(val, opts, policy=OptionsPolicy.NEAREST) == expected